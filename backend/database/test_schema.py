@@ -9,6 +9,7 @@ Author: Claude (GitHub Issue #2)
 Created: 2025-08-04
 """
 
+import importlib.util
 import logging
 import os
 import re
@@ -179,12 +180,17 @@ def test_python_imports() -> bool:
 
     errors = []
 
+    # Locate each package without executing its module code
     for package in required_packages:
         try:
-            __import__(package)
-            logger.debug(f"Successfully imported {package}")
+            spec = importlib.util.find_spec(package)
         except ImportError as e:
             errors.append(f"Failed to import {package}: {e}")
+            continue
+        if spec is None:
+            errors.append(f"Failed to import {package}: module not found")
+        else:
+            logger.debug(f"Found {package}")
 
     if errors:
         logger.error("Python package import test failed:")
@@ -28,6 +28,33 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Chrome command-line arguments shared by every driver; the user agent is
+# appended per scraper
+CHROME_ARGUMENTS = (
+    # Headless mode for production
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-images",
+    "--disable-javascript",  # Can be overridden if JS needed
+    # Window size for consistent rendering
+    "--window-size=1920,1080",
+    # Performance optimizations
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    # Security settings
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+)
+
 
 class ScrapingError(Exception):
     """Custom exception for scraping-related errors."""
@@ -72,6 +99,27 @@ class BaseScraper(ABC):
 
         logger.info(f"Initialized scraper for outlet: {self.outlet_name}")
 
+    def _chrome_options(self) -> Options:
+        """
+        Build fresh Chrome options for this scraper.
+
+        The WebDriver writes to the options it is given, so every driver gets
+        its own instance built from the shared argument tuple.
+
+        Returns:
+            Configured Chrome options
+        """
+        user_agent = self.config.get("user_agent", DEFAULT_USER_AGENT)
+
+        chrome_options = Options()
+        for argument in CHROME_ARGUMENTS:
+            chrome_options.add_argument(argument)
+
+        # User agent for realistic requests
+        chrome_options.add_argument(f"--user-agent={user_agent}")
+
+        return chrome_options
+
     def setup_driver(self) -> webdriver.Chrome:
         """
         Set up and configure Chrome WebDriver with optimal settings.
@@ -83,37 +131,7 @@ class BaseScraper(ABC):
             ScrapingError: If driver setup fails
         """
         try:
-            chrome_options = Options()
-
-            # Headless mode for production
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-images")
-            chrome_options.add_argument(
-                "--disable-javascript"
-            )  # Can be overridden if JS needed
-
-            # Window size for consistent rendering
-            chrome_options.add_argument("--window-size=1920,1080")
-
-            # User agent for realistic requests
-            user_agent = self.config.get(
-                "user_agent",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            )
-            chrome_options.add_argument(f"--user-agent={user_agent}")
-
-            # Performance optimizations
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-
-            # Security settings
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
+            chrome_options = self._chrome_options()
 
             # Create driver
             self.driver = webdriver.Chrome(options=chrome_options)
@@ -316,6 +334,23 @@ class OutletScraper(BaseScraper):
     Uses configuration-driven selectors to handle different outlet structures.
     """
 
+    def __init__(self, outlet_config: Dict[str, Any]) -> None:
+        """
+        Initialize the scraper and resolve its selectors once.
+
+        Args:
+            outlet_config: Dictionary containing outlet configuration including
+                          URL, selectors, timeouts, and retry settings
+        """
+        super().__init__(outlet_config)
+
+        # Resolved once here so scraping each article is attribute loads only
+        self._sel_links: Optional[str] = self.selectors.get("article_links")
+        self._sel_title: Optional[str] = self.selectors.get("title")
+        self._sel_content: Optional[str] = self.selectors.get("content")
+        self._sel_author: Optional[str] = self.selectors.get("author")
+        self._sel_date: Optional[str] = self.selectors.get("date")
+
     def scrape_article_list(self) -> List[str]:
         """
         Extract article URLs using configured selectors.
@@ -324,7 +359,7 @@ class OutletScraper(BaseScraper):
             List of absolute article URLs
         """
         try:
-            article_links_selector = self.selectors.get("article_links")
+            article_links_selector = self._sel_links
             if not article_links_selector:
                 logger.error(
                     f"No article_links selector configured for {self.outlet_name}"
@@ -388,14 +423,14 @@ class OutletScraper(BaseScraper):
                 return article_data
 
             # Extract title
-            title_selector = self.selectors.get("title")
+            title_selector = self._sel_title
             if title_selector:
                 title_element = self.safe_find_element(By.CSS_SELECTOR, title_selector)
                 if title_element:
                     article_data["title"] = title_element.text.strip()
 
             # Extract content
-            content_selector = self.selectors.get("content")
+            content_selector = self._sel_content
             if content_selector:
                 content_elements = self.safe_find_elements(
                     By.CSS_SELECTOR, content_selector
@@ -407,7 +442,7 @@ class OutletScraper(BaseScraper):
                 article_data["content"] = "\n\n".join(content_parts)
 
             # Extract author
-            author_selector = self.selectors.get("author")
+            author_selector = self._sel_author
             if author_selector:
                 author_element = self.safe_find_element(
                     By.CSS_SELECTOR, author_selector
@@ -416,7 +451,7 @@ class OutletScraper(BaseScraper):
                     article_data["author"] = author_element.text.strip()
 
             # Extract date
-            date_selector = self.selectors.get("date")
+            date_selector = self._sel_date
             if date_selector:
                 date_element = self.safe_find_element(By.CSS_SELECTOR, date_selector)
                 if date_element:
@@ -15,6 +15,9 @@ from typing import Any, Dict, List, Optional, Union
 import yaml  # type: ignore
 from loguru import logger
 
+# libyaml's C loader when PyYAML was built with it; same safe subset, much faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigurationError(Exception):
     """Exception raised for configuration-related errors."""
@@ -60,13 +63,7 @@ class ConfigLoader:
             ConfigurationError: If file cannot be loaded or parsed
         """
         try:
-            if not self.config_path.exists():
-                raise ConfigurationError(
-                    f"Configuration file not found: {self.config_path}"
-                )
-
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                self.config_data = yaml.safe_load(file)
+            self.config_data = yaml.load(self._read_text(), Loader=_SafeLoader)
 
             if not self.config_data:
                 raise ConfigurationError("Configuration file is empty or invalid")
@@ -84,6 +81,23 @@ class ConfigLoader:
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {e}")
 
+    def _read_text(self) -> str:
+        """
+        Read the raw YAML text of the configuration file.
+
+        Returns:
+            Contents of the configuration file
+
+        Raises:
+            ConfigurationError: If the file does not exist
+        """
+        if not self.config_path.exists():
+            raise ConfigurationError(
+                f"Configuration file not found: {self.config_path}"
+            )
+
+        return self.config_path.read_text(encoding="utf-8")
+
     def get_outlet_config(self, outlet_name: str) -> Dict[str, Any]:
         """
         Get configuration for a specific outlet with defaults merged.
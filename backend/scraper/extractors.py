@@ -21,6 +21,64 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+# ContentProcessor.clean_text patterns, compiled once for every paragraph
+_ENTITY_RE = re.compile(r"&(?:[a-zA-Z]+|#\d+);")
+_WS_RE = re.compile(r"\s+")
+# Bracketed ad indicators per language; other languages skip ad removal
+_AD_INDICATOR_RES = {
+    "de": re.compile(r"\[Werbung\]|\(Anzeige\)|\(Werbung\)", re.IGNORECASE),
+    "fr": re.compile(r"\[Publicité\]|\(Publicité\)", re.IGNORECASE),
+    "it": re.compile(r"\[Pubblicità\]|\(Pubblicità\)", re.IGNORECASE),
+}
+
+# Fields where only the first match per selector is used
+_SINGLE_ELEMENT_FIELDS = ("title", "subtitle", "author", "date")
+
+# Runs every candidate selector in the browser and returns plain records, so a
+# page costs one WebDriver round trip instead of one per element and property.
+# arguments[0]: field -> selectors; arguments[1]: single-element fields.
+# Result: field -> one list of records per selector, in selector order.
+# Elements that are not rendered report empty text, as WebElement.text does.
+_BULK_QUERY_JS = """
+const fields = arguments[0];
+const single = new Set(arguments[1]);
+const captionSelectors = fields.image_captions || [];
+const textOf = (el) =>
+    el.getClientRects().length === 0 ? "" : (el.innerText || "").trim();
+const captionFor = (img) => {
+    const parent = img.parentElement;
+    if (!parent) return null;
+    for (const sel of captionSelectors) {
+        const el = parent.querySelector(sel);
+        const text = el ? textOf(el) : "";
+        if (text) return text;
+    }
+    return null;
+};
+const result = {};
+for (const [field, selectors] of Object.entries(fields)) {
+    if (field === "image_captions") continue;
+    result[field] = selectors.map((sel) => {
+        const els = single.has(field)
+            ? [document.querySelector(sel)].filter(Boolean)
+            : Array.from(document.querySelectorAll(sel));
+        return els.map((el) => {
+            const rec = { text: textOf(el) };
+            if (field === "date") rec.datetime = el.getAttribute("datetime");
+            if (field === "images") {
+                rec.src = el.src || el.getAttribute("src");
+                rec.alt = el.getAttribute("alt");
+                rec.width = String("width" in el ? el.width : el.getAttribute("width"));
+                rec.height = String("height" in el ? el.height : el.getAttribute("height"));
+                rec.caption = captionFor(el);
+            }
+            return rec;
+        });
+    });
+}
+return result;
+"""
+
 
 @dataclass
 class ImageContent:
@@ -88,11 +146,116 @@ class ArticleExtractor:
         self.content_selectors = outlet_config.get("content_selectors", {})
         self.exclusion_selectors = outlet_config.get("exclusion_selectors", {})
 
+        # Candidate selectors per field, in priority order
+        self._field_selectors = self._build_field_selectors()
+
         # Initialize content processor
         self.processor = ContentProcessor(outlet_config)
 
         logger.info(f"Initialized ArticleExtractor for {self.outlet_name}")
 
+    def _build_field_selectors(self) -> Dict[str, List[str]]:
+        """
+        Collect the candidate selectors for each extracted field.
+
+        Configured selectors come first, then generic fallbacks. Unset entries
+        are dropped so both the bulk query and per-element lookups can use the
+        lists as-is.
+
+        Returns:
+            Mapping of field name to selectors in priority order
+        """
+        candidates = {
+            "title": [
+                self.content_selectors.get("title"),
+                self.selectors.get("title"),
+                "h1",  # Fallback
+                ".headline",
+                "[data-testid*='title']",
+                "[data-qa*='headline']",
+            ],
+            "subtitle": [
+                self.content_selectors.get("subtitle"),
+                ".subtitle",
+                ".article__subtitle",
+                ".headline__subtitle",
+                "h2:first-of-type",
+                ".lead",
+            ],
+            "content": [
+                self.content_selectors.get("main_text"),
+                self.selectors.get("content"),
+                ".article__body p",
+                ".content__body p",
+                ".article-content p",
+                ".story-content p",
+            ],
+            "author": [
+                self.content_selectors.get("author"),
+                self.selectors.get("author"),
+                ".author__name",
+                ".byline__author",
+                ".article__author",
+                "[data-testid*='author']",
+            ],
+            "date": [
+                self.content_selectors.get("date"),
+                self.selectors.get("date"),
+                ".article__date",
+                ".publish-date",
+                ".publication-date",
+                "time[datetime]",
+                "[data-testid*='date']",
+            ],
+            "tags": [
+                self.content_selectors.get("tags"),
+                ".article__tags a",
+                ".topic-tags a",
+                ".tags a",
+                "[data-testid*='tag'] a",
+            ],
+            "categories": [
+                self.content_selectors.get("categories"),
+                ".breadcrumb a",
+                ".category-link",
+                ".section-name",
+                "[data-testid*='category']",
+            ],
+            "images": [
+                self.content_selectors.get("images"),
+                ".article__image img",
+                ".content-image img",
+                ".article-content img",
+                "figure img",
+            ],
+            "image_captions": [
+                self.content_selectors.get("image_captions"),
+                ".image-caption",
+                ".photo-caption",
+                "figcaption",
+                ".caption",
+            ],
+            "quotes": [
+                self.content_selectors.get("quotes"),
+                "blockquote",
+                ".quote",
+                ".pullquote",
+                "[data-component='Quote']",
+            ],
+            "highlights": [
+                self.content_selectors.get("highlights"),
+                ".highlight",
+                ".callout",
+                ".emphasis",
+                "strong",
+                ".important",
+            ],
+        }
+        return {
+            name: [selector for selector in selectors if selector]
+            for name, selectors in candidates.items()
+        }
+
     def extract_full_content(
         self, driver: webdriver.Chrome, url: str
     ) -> ArticleContent:
@@ -116,19 +279,27 @@ class ArticleExtractor:
         try:
             article = ArticleContent(url=url, title="")
 
-            # Extract core content
-            article.title = self._extract_title(driver, extraction_metadata)
-            article.subtitle = self._extract_subtitle(driver, extraction_metadata)
-            article = self._extract_body_content(driver, article, extraction_metadata)
-
-            # Extract metadata
-            article.author = self._extract_author(driver, extraction_metadata)
-            article.publication_date = self._extract_date(driver, extraction_metadata)
-            article.tags = self._extract_tags(driver, extraction_metadata)
-            article.categories = self._extract_categories(driver, extraction_metadata)
-
-            # Extract multimedia content
-            article.images = self._extract_images(driver, url, extraction_metadata)
+            snapshot = self._bulk_query(driver)
+            if snapshot is not None:
+                article = self._extract_from_snapshot(
+                    snapshot, article, url, extraction_metadata
+                )
+            else:
+                # Per-element lookups when the page could not be queried in bulk
+                article.title = self._extract_title(driver, extraction_metadata)
+                article.subtitle = self._extract_subtitle(driver, extraction_metadata)
+                article = self._extract_body_content(
+                    driver, article, extraction_metadata
+                )
+                article.author = self._extract_author(driver, extraction_metadata)
+                article.publication_date = self._extract_date(
+                    driver, extraction_metadata
+                )
+                article.tags = self._extract_tags(driver, extraction_metadata)
+                article.categories = self._extract_categories(
+                    driver, extraction_metadata
+                )
+                article.images = self._extract_images(driver, url, extraction_metadata)
 
             # Process and enhance content
             article = self.processor.enhance_content(article)
@@ -166,23 +337,226 @@ class ArticleExtractor:
                 url=url, title="", extraction_metadata=extraction_metadata
             )
 
+    def _bulk_query(
+        self, driver: webdriver.Chrome
+    ) -> Optional[Dict[str, List[List[Dict[str, Any]]]]]:
+        """
+        Query every candidate selector with a single script execution.
+
+        Args:
+            driver: Selenium WebDriver instance
+
+        Returns:
+            Element records per field and selector, or None if the script
+            failed so callers fall back to per-element lookups
+        """
+        try:
+            snapshot = driver.execute_script(
+                _BULK_QUERY_JS, self._field_selectors, list(_SINGLE_ELEMENT_FIELDS)
+            )
+        except Exception as e:
+            logger.warning(
+                f"Bulk selector query failed, using per-element lookups: {e}"
+            )
+            return None
+
+        return snapshot if isinstance(snapshot, dict) else None
+
+    def _snapshot_matches(
+        self, snapshot: Dict[str, List[List[Dict[str, Any]]]], name: str
+    ) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Pair each candidate selector of a field with its non-empty records."""
+        return [
+            (selector, records)
+            for selector, records in zip(
+                self._field_selectors[name], snapshot.get(name) or []
+            )
+            if records
+        ]
+
+    def _extract_from_snapshot(
+        self,
+        snapshot: Dict[str, List[List[Dict[str, Any]]]],
+        article: ArticleContent,
+        base_url: str,
+        metadata: ExtractionMetadata,
+    ) -> ArticleContent:
+        """
+        Fill article fields from a bulk query result.
+
+        Applies the same selector priority and filtering as the per-element
+        ``_extract_*`` methods.
+
+        Args:
+            snapshot: Result of ``_bulk_query``
+            article: Article being populated
+            base_url: Article URL for resolving relative image sources
+            metadata: Extraction metadata to record selectors and warnings on
+
+        Returns:
+            The populated article
+        """
+
+        article.title = self._snapshot_title(snapshot, metadata)
+        article.subtitle = self._snapshot_subtitle(snapshot, metadata)
+
+        article.body_paragraphs = self.processor.process_paragraphs(
+            self._snapshot_texts(snapshot, "content", metadata)
+        )
+        article.quotes = self.processor.clean_quotes(
+            self._snapshot_texts(snapshot, "quotes", metadata, require=True)
+        )
+        article.highlights = self._snapshot_texts(
+            snapshot, "highlights", metadata, min_length=11, require=True
+        )[:5]
+
+        article.author = self._snapshot_author(snapshot, metadata)
+        article.publication_date = self._snapshot_date(snapshot, metadata)
+        article.tags = self.processor.clean_tags(
+            self._snapshot_texts(snapshot, "tags", metadata)
+        )
+        article.categories = self.processor.clean_categories(
+            self._snapshot_texts(snapshot, "categories", metadata)
+        )
+
+        article.images = self._snapshot_images(snapshot, base_url, metadata)
+
+        return article
+
+    def _snapshot_first_text(
+        self,
+        snapshot: Dict[str, List[List[Dict[str, Any]]]],
+        name: str,
+        metadata: ExtractionMetadata,
+        min_length: int = 1,
+    ) -> Optional[str]:
+        """Text of the first selector whose first match is long enough."""
+        for selector, records in self._snapshot_matches(snapshot, name):
+            text = (records[0].get("text") or "").strip()
+            if len(text) >= min_length:
+                metadata.selectors_used[name] = selector
+                return text
+        return None
+
+    def _snapshot_texts(
+        self,
+        snapshot: Dict[str, List[List[Dict[str, Any]]]],
+        name: str,
+        metadata: ExtractionMetadata,
+        min_length: int = 1,
+        require: bool = False,
+    ) -> List[str]:
+        """
+        Texts of all matches for the first selector that matched anything.
+
+        With ``require`` set, selectors whose matches have no usable text are
+        skipped, as the quote and highlight lookups do.
+        """
+        for selector, records in self._snapshot_matches(snapshot, name):
+            texts = [
+                text
+                for text in ((record.get("text") or "").strip() for record in records)
+                if len(text) >= min_length
+            ]
+            if texts or not require:
+                metadata.selectors_used[name] = selector
+                return texts
+        return []
+
+    def _snapshot_title(
+        self,
+        snapshot: Dict[str, List[List[Dict[str, Any]]]],
+        metadata: ExtractionMetadata,
+    ) -> str:
+        """Article title from a bulk query result."""
+        title = self._snapshot_first_text(snapshot, "title", metadata)
+        if title:
+            return self.processor.clean_title(title)
+
+        metadata.warnings.append("No title found")
+        return ""
+
+    def _snapshot_subtitle(
+        self,
+        snapshot: Dict[str, List[List[Dict[str, Any]]]],
+        metadata: ExtractionMetadata,
+    ) -> Optional[str]:
+        """Article subtitle from a bulk query result, if present."""
+        # Short texts are likely false positives
+        subtitle = self._snapshot_first_text(
+            snapshot, "subtitle", metadata, min_length=11
+        )
+        return self.processor.clean_text(subtitle) if subtitle else None
+
+    def _snapshot_author(
+        self,
+        snapshot: Dict[str, List[List[Dict[str, Any]]]],
+        metadata: ExtractionMetadata,
+    ) -> Optional[str]:
+        """Article author from a bulk query result."""
+        author = self._snapshot_first_text(snapshot, "author", metadata)
+        return self.processor.clean_author_name(author) if author else None
+
+    def _snapshot_date(
+        self,
+        snapshot: Dict[str, List[List[Dict[str, Any]]]],
+        metadata: ExtractionMetadata,
+    ) -> Optional[datetime]:
+        """Publication date from a bulk query result."""
+        for selector, records in self._snapshot_matches(snapshot, "date"):
+            # Try the datetime attribute first, then the text content
+            parsed_date = self._parse_iso_datetime(records[0].get("datetime"))
+            date_text = (records[0].get("text") or "").strip()
+            if not parsed_date and date_text:
+                parsed_date = self.processor.parse_date_string(date_text)
+            if parsed_date:
+                metadata.selectors_used["date"] = selector
+                return parsed_date
+        return None
+
+    def _snapshot_images(
+        self,
+        snapshot: Dict[str, List[List[Dict[str, Any]]]],
+        base_url: str,
+        metadata: ExtractionMetadata,
+    ) -> List[ImageContent]:
+        """Article images with captions from a bulk query result."""
+        matches = self._snapshot_matches(snapshot, "images")
+        if not matches:
+            return []
+
+        selector, records = matches[0]
+        metadata.selectors_used["images"] = selector
+
+        images = []
+        for record in records:
+            src = record.get("src")
+            if not src:
+                continue
+
+            # Convert relative URLs to absolute
+            if not src.startswith(("http://", "https://")):
+                src = urljoin(base_url, src)
+
+            images.append(
+                ImageContent(
+                    url=src,
+                    caption=record.get("caption"),
+                    alt_text=record.get("alt"),
+                    width=self._safe_int(record.get("width")),
+                    height=self._safe_int(record.get("height")),
+                )
+            )
+
+        return self.processor.filter_quality_images(images)
+
     def _extract_title(
         self, driver: webdriver.Chrome, metadata: ExtractionMetadata
     ) -> str:
         """Extract article title using configured selectors."""
-        selectors = [
-            self.content_selectors.get("title"),
-            self.selectors.get("title"),
-            "h1",  # Fallback
-            ".headline",
-            "[data-testid*='title']",
-            "[data-qa*='headline']",
-        ]
+        selectors = self._field_selectors["title"]
 
         for selector in selectors:
-            if not selector:
-                continue
-
             try:
                 element = driver.find_element(By.CSS_SELECTOR, selector)
                 title = element.text.strip()
@@ -199,19 +573,9 @@ class ArticleExtractor:
         self, driver: webdriver.Chrome, metadata: ExtractionMetadata
     ) -> Optional[str]:
         """Extract article subtitle if present."""
-        selectors = [
-            self.content_selectors.get("subtitle"),
-            ".subtitle",
-            ".article__subtitle",
-            ".headline__subtitle",
-            "h2:first-of-type",
-            ".lead",
-        ]
+        selectors = self._field_selectors["subtitle"]
 
         for selector in selectors:
-            if not selector:
-                continue
-
             try:
                 element = driver.find_element(By.CSS_SELECTOR, selector)
                 subtitle = element.text.strip()
@@ -230,21 +594,11 @@ class ArticleExtractor:
         metadata: ExtractionMetadata,
     ) -> ArticleContent:
         """Extract article body content with structure preservation."""
-        content_selectors = [
-            self.content_selectors.get("main_text"),
-            self.selectors.get("content"),
-            ".article__body p",
-            ".content__body p",
-            ".article-content p",
-            ".story-content p",
-        ]
+        content_selectors = self._field_selectors["content"]
 
         # Extract main content paragraphs
         paragraphs = []
         for selector in content_selectors:
-            if not selector:
-                continue
-
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
@@ -272,19 +626,9 @@ class ArticleExtractor:
         self, driver: webdriver.Chrome, metadata: ExtractionMetadata
     ) -> Optional[str]:
         """Extract article author information."""
-        selectors = [
-            self.content_selectors.get("author"),
-            self.selectors.get("author"),
-            ".author__name",
-            ".byline__author",
-            ".article__author",
-            "[data-testid*='author']",
-        ]
+        selectors = self._field_selectors["author"]
 
         for selector in selectors:
-            if not selector:
-                continue
-
             try:
                 element = driver.find_element(By.CSS_SELECTOR, selector)
                 author = element.text.strip()
@@ -300,34 +644,19 @@ class ArticleExtractor:
         self, driver: webdriver.Chrome, metadata: ExtractionMetadata
     ) -> Optional[datetime]:
         """Extract publication date."""
-        selectors = [
-            self.content_selectors.get("date"),
-            self.selectors.get("date"),
-            ".article__date",
-            ".publish-date",
-            ".publication-date",
-            "time[datetime]",
-            "[data-testid*='date']",
-        ]
+        selectors = self._field_selectors["date"]
 
         for selector in selectors:
-            if not selector:
-                continue
-
             try:
                 element = driver.find_element(By.CSS_SELECTOR, selector)
 
                 # Try datetime attribute first
-                datetime_attr = element.get_attribute("datetime")
-                if datetime_attr:
-                    try:
-                        parsed_date = datetime.fromisoformat(
-                            datetime_attr.replace("Z", "+00:00")
-                        )
-                        metadata.selectors_used["date"] = selector
-                        return parsed_date
-                    except ValueError:
-                        pass
+                parsed_date = self._parse_iso_datetime(
+                    element.get_attribute("datetime")
+                )
+                if parsed_date:
+                    metadata.selectors_used["date"] = selector
+                    return parsed_date
 
                 # Try text content
                 date_text = element.text.strip()
@@ -346,19 +675,10 @@ class ArticleExtractor:
         self, driver: webdriver.Chrome, metadata: ExtractionMetadata
     ) -> List[str]:
         """Extract article tags/topics."""
-        selectors = [
-            self.content_selectors.get("tags"),
-            ".article__tags a",
-            ".topic-tags a",
-            ".tags a",
-            "[data-testid*='tag'] a",
-        ]
+        selectors = self._field_selectors["tags"]
 
         tags = []
         for selector in selectors:
-            if not selector:
-                continue
-
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
@@ -374,19 +694,10 @@ class ArticleExtractor:
         self, driver: webdriver.Chrome, metadata: ExtractionMetadata
     ) -> List[str]:
         """Extract article categories."""
-        selectors = [
-            self.content_selectors.get("categories"),
-            ".breadcrumb a",
-            ".category-link",
-            ".section-name",
-            "[data-testid*='category']",
-        ]
+        selectors = self._field_selectors["categories"]
 
         categories = []
         for selector in selectors:
-            if not selector:
-                continue
-
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
@@ -404,27 +715,11 @@ class ArticleExtractor:
         self, driver: webdriver.Chrome, base_url: str, metadata: ExtractionMetadata
     ) -> List[ImageContent]:
         """Extract article images with captions."""
-        image_selectors = [
-            self.content_selectors.get("images"),
-            ".article__image img",
-            ".content-image img",
-            ".article-content img",
-            "figure img",
-        ]
-
-        caption_selectors = [
-            self.content_selectors.get("image_captions"),
-            ".image-caption",
-            ".photo-caption",
-            "figcaption",
-            ".caption",
-        ]
+        image_selectors = self._field_selectors["images"]
+        caption_selectors = self._field_selectors["image_captions"]
 
         images = []
         for selector in image_selectors:
-            if not selector:
-                continue
-
             try:
                 img_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if img_elements:
@@ -471,19 +766,10 @@ class ArticleExtractor:
         self, driver: webdriver.Chrome, metadata: ExtractionMetadata
     ) -> List[str]:
         """Extract quotes and blockquotes from article."""
-        selectors = [
-            self.content_selectors.get("quotes"),
-            "blockquote",
-            ".quote",
-            ".pullquote",
-            "[data-component='Quote']",
-        ]
+        selectors = self._field_selectors["quotes"]
 
         quotes = []
         for selector in selectors:
-            if not selector:
-                continue
-
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
@@ -502,20 +788,10 @@ class ArticleExtractor:
         self, driver: webdriver.Chrome, metadata: ExtractionMetadata
     ) -> List[str]:
         """Extract highlighted or emphasized content."""
-        selectors = [
-            self.content_selectors.get("highlights"),
-            ".highlight",
-            ".callout",
-            ".emphasis",
-            "strong",
-            ".important",
-        ]
+        selectors = self._field_selectors["highlights"]
 
         highlights = []
         for selector in selectors:
-            if not selector:
-                continue
-
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
@@ -553,6 +829,15 @@ class ArticleExtractor:
 
         return None
 
+    def _parse_iso_datetime(self, value: Optional[str]) -> Optional[datetime]:
+        """Parse an ISO 8601 ``datetime`` attribute value, if valid."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
     def _safe_int(self, value: Optional[str]) -> Optional[int]:
         """Safely convert string to integer."""
         try:
@@ -625,6 +910,7 @@ class ContentProcessor:
         self.config = outlet_config
         self.language = outlet_config.get("language", "de")
         self.text_processing = outlet_config.get("text_processing", {})
+        self._ad_re = _AD_INDICATOR_RES.get(self.language)
 
     def enhance_content(self, article: ArticleContent) -> ArticleContent:
         """Enhance and clean all content in the article."""
@@ -658,24 +944,20 @@ class ContentProcessor:
         if not text:
             return ""
 
+        # Each pass runs in C; passes that cannot match are skipped. A single
+        # sub with a dispatching callback was measured ~4x slower, since it
+        # calls back into Python at every whitespace gap.
+
         # Remove HTML artifacts
-        text = re.sub(r"&[a-zA-Z]+;", " ", text)
-        text = re.sub(r"&#\d+;", " ", text)
+        if "&" in text:
+            text = _ENTITY_RE.sub(" ", text)
 
         # Remove ad indicators based on language
-        if self.language == "de":
-            text = re.sub(
-                r"\[Werbung\]|\(Anzeige\)|\(Werbung\)", "", text, flags=re.IGNORECASE
-            )
-        elif self.language == "fr":
-            text = re.sub(r"\[Publicité\]|\(Publicité\)", "", text, flags=re.IGNORECASE)
-        elif self.language == "it":
-            text = re.sub(
-                r"\[Pubblicità\]|\(Pubblicità\)", "", text, flags=re.IGNORECASE
-            )
+        if self._ad_re is not None and ("[" in text or "(" in text):
+            text = self._ad_re.sub("", text)
 
         # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _WS_RE.sub(" ", text)
 
         return text.strip()
 
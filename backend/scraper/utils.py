@@ -8,15 +8,173 @@ URL validation, retry decorators, and helper functions for the scraper framework
 Issue: https://github.com/devpouya/swissnews/issues/3
 """
 
+import html
 import re
 import time
 from datetime import datetime, timezone
-from functools import wraps
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Match, Optional, Pattern
 from urllib.parse import urljoin, urlparse, urlunparse
 
 from loguru import logger
 
+# Patterns are compiled once at import time; these helpers run per paragraph
+# and per URL, so per-call compilation and cache lookups add up over a crawl.
+
+# Bracketed content like [Advertisement] and German, French and Italian ads,
+# removed together in one scan
+_ADS_RE = re.compile(
+    r"\[.*?\]|\(.*?(?:Werbung|Publicité|Pubblicità).*?\)", re.IGNORECASE
+)
+# Email addresses and phone numbers (privacy); only + prefixed numbers match
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+_PHONE_RE = re.compile(r"\+[\d\s\-\(\)]{8,}")
+_WS_RE = re.compile(r"\s+")
+
+# Word tokens for similarity scoring
+_WORD_RE = re.compile(r"\w+")
+
+# HTML entities decoded by clean_text, replaced in a single pass
+_ENTITY_MAP = {
+    "&nbsp;": " ",
+    "&amp;": "&",
+    "&lt;": "<",
+    "&gt;": ">",
+    "&quot;": '"',
+    "&#39;": "'",
+}
+_ENTITY_RE = re.compile(r"&(?:nbsp|amp|lt|gt|quot|#39);")
+
+# Query parameters dropped by normalize_url, matched on the parameter name
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "ref"})
+_TRACKING_PARAM_PREFIXES = ("utm_", "_ga")
+
+# Default article URL patterns for Swiss news sites, fused into one regex
+_ARTICLE_RE = re.compile(
+    "|".join(
+        (
+            r"/article/",
+            r"/story/",
+            r"/news/",
+            r"/\d{4}/\d{2}/\d{2}/",  # Date patterns
+            r"/[a-z]+-[a-z]+-[a-z]+",  # Hyphenated titles
+            r"/\d+/",  # Article IDs
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Common non-article URLs (only applied with the default patterns)
+_EXCLUSION_RE = re.compile(
+    "|".join(
+        (
+            r"/category/",
+            r"/tag/",
+            r"/author/",
+            r"/search",
+            r"/archive",
+            r"/feed",
+            r"/rss",
+            r"/sitemap",
+            r"/contact",
+            r"/about",
+            r"/impressum",
+            r"/datenschutz",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Language hints in URLs: known outlet domains first, then path segments
+_LANGUAGE_DOMAINS = {
+    "nzz.ch": "de",
+    "20min.ch": "de",
+    "srf.ch": "de",
+    "letemps.ch": "fr",
+    "rts.ch": "fr",
+    "tdg.ch": "fr",
+    "cdt.ch": "it",
+    "rsi.ch": "it",
+    "laregione.ch": "it",
+}
+_LANGUAGE_DOMAIN_RE = re.compile(
+    "|".join(re.escape(domain) for domain in _LANGUAGE_DOMAINS), re.IGNORECASE
+)
+_LANGUAGE_PATHS = {
+    "de": "de",
+    "deutsch": "de",
+    "fr": "fr",
+    "francais": "fr",
+    "it": "it",
+    "italiano": "it",
+    "rm": "rm",
+    "romansh": "rm",
+}
+_LANGUAGE_PATH_RE = re.compile(f"/({'|'.join(_LANGUAGE_PATHS)})/", re.IGNORECASE)
+
+# format_filesize units; larger sizes are still reported in GB
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+_MAX_SIZE_UNIT = len(_SIZE_UNITS) - 1
+
+# Common date formats in Swiss news, told apart by separator and year position:
+#   01.01.2024 14:30 / 01.01.2024, 2024-01-01 14:30:00 / 2024-01-01,
+#   01/01/2024 (day first, falling back to US month first)
+_DATE_RE = re.compile(
+    r"(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.(?P<year>\d{4})"
+    r"(?: (?P<hour>\d{1,2}):(?P<minute>\d{1,2}))?"
+    r"|(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})"
+    r"(?: (?P<iso_hour>\d{1,2}):(?P<iso_minute>\d{1,2}):(?P<iso_second>\d{1,2}))?"
+    r"|(?P<slash_a>\d{1,2})/(?P<slash_b>\d{1,2})/(?P<slash_year>\d{4})"
+)
+_ISO_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T")
+_RELATIVE_DATE_RE = re.compile(r"vor|minutes|stunden|heute", re.IGNORECASE)
+
+# Language-specific ad markers removed by remove_ad_content, one alternation
+# per language so a single scan strips them all (unknown languages use German)
+_AD_MARKERS = {
+    "de": (
+        r"\[Werbung\]",
+        r"\(Anzeige\)",
+        r"\(Werbung\)",
+        r"Anzeige\s*:",
+        r"Sponsored\s*:",
+        r"Partner-Inhalte?",
+        r"Werbliche\s+Inhalte?",
+    ),
+    "fr": (
+        r"\[Publicité\]",
+        r"\(Publicité\)",
+        r"Publicité\s*:",
+        r"Contenu\s+sponsorisé",
+        r"Partenaire\s*:",
+        r"Sponsored\s*:",
+    ),
+    "it": (
+        r"\[Pubblicità\]",
+        r"\(Pubblicità\)",
+        r"Pubblicità\s*:",
+        r"Contenuto\s+sponsorizzato",
+        r"Partner\s*:",
+        r"Sponsored\s*:",
+    ),
+}
+_AD_PATTERNS = {
+    language: re.compile("|".join(markers), re.IGNORECASE)
+    for language, markers in _AD_MARKERS.items()
+}
+
+# Decoded punctuation that clean_html_artifacts folds back to ASCII
+_ASCII_PUNCTUATION = str.maketrans({"\u2026": "...", "\u2018": "'", "\u2019": "'"})
+
+# Named and numeric entities, markup and control characters
+_ANY_ENTITY_RE = re.compile(r"&(?:[a-zA-Z][a-zA-Z0-9]*|#\d+|#x[0-9a-fA-F]+);")
+_TAG_RE = re.compile(r"<[^>]+>")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]")
+
+# Author name patterns; most bylines are plain ASCII and take the bytes path
+_AUTHOR_ASCII_RE = re.compile(rb"^[A-Za-z\s\-.\']+$")
+_AUTHOR_UNICODE_RE = re.compile(r"^[A-Za-zÀ-ÿĀ-žА-я\s\-.\']+$")
+
 
 def retry(
     max_attempts: int = 3, delay: float = 1.0, backoff_factor: float = 2.0
@@ -46,14 +204,20 @@ def retry(
                     last_exception = e
                     if attempt < max_attempts - 1:
                         logger.warning(
-                            f"Attempt {attempt + 1} failed for {func.__name__}: {e}. "
-                            f"Retrying in {current_delay:.2f} seconds..."
+                            "Attempt {} failed for {}: {}. Retrying in {:.2f} seconds...",
+                            attempt + 1,
+                            func.__name__,
+                            e,
+                            current_delay,
                         )
                         time.sleep(current_delay)
                         current_delay *= backoff_factor
                     else:
                         logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}: {e}"
+                            "All {} attempts failed for {}: {}",
+                            max_attempts,
+                            func.__name__,
+                            e,
                         )
 
             raise last_exception
@@ -77,36 +241,19 @@ def clean_text(text: str) -> str:
         return ""
 
     # Remove HTML entities and decode them
-    text = text.replace("&nbsp;", " ")
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
-    text = text.replace("&quot;", '"')
-    text = text.replace("&#39;", "'")
-
-    # Remove common web artifacts
-    text = re.sub(r"\[.*?\]", "", text)  # Remove bracketed content like [Advertisement]
-    text = re.sub(
-        r"\(.*?Werbung.*?\)", "", text, flags=re.IGNORECASE
-    )  # Remove German ads
-    text = re.sub(
-        r"\(.*?Publicité.*?\)", "", text, flags=re.IGNORECASE
-    )  # Remove French ads
-    text = re.sub(
-        r"\(.*?Pubblicità.*?\)", "", text, flags=re.IGNORECASE
-    )  # Remove Italian ads
-
-    # Remove email addresses and phone numbers (privacy)
-    text = re.sub(
-        r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", "[email]", text
-    )
-    text = re.sub(
-        r"\+[\d\s\-\(\)]{8,}", "[phone]", text
-    )  # Only match + prefixed numbers
+    if "&" in text:
+        text = _ENTITY_RE.sub(lambda m: _ENTITY_MAP[m.group(0)], text)
+
+    # Remove web artifacts and personal info, skipping passes that cannot match
+    if "[" in text or "(" in text:
+        text = _ADS_RE.sub("", text)
+    if "@" in text:
+        text = _EMAIL_RE.sub("[email]", text)
+    if "+" in text:
+        text = _PHONE_RE.sub("[phone]", text)
 
     # Remove extra whitespace and normalize (after all replacements)
-    text = re.sub(r"\s+", " ", text)
-    text = text.strip()
+    text = _WS_RE.sub(" ", text)
 
     return text.strip()
 
@@ -143,11 +290,12 @@ def normalize_url(url: str, base_url: str = "") -> str:
     if parsed.query:
         query_params = []
         for param in parsed.query.split("&"):
-            if param and not any(
-                tracking in param.lower()
-                for tracking in ["utm_", "fbclid", "gclid", "_ga", "ref="]
-            ):
-                query_params.append(param)
+            if not param:
+                continue
+            key = param.partition("=")[0].lower()
+            if key in _TRACKING_PARAMS or key.startswith(_TRACKING_PARAM_PREFIXES):
+                continue
+            query_params.append(param)
         parsed = parsed._replace(query="&".join(query_params))
 
     return urlunparse(parsed)
@@ -172,6 +320,7 @@ def is_valid_url(url: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
     Extract domain name from URL.
@@ -200,55 +349,38 @@ def is_article_url(url: str, article_patterns: Optional[List[str]] = None) -> bo
     Returns:
         True if URL appears to be an article, False otherwise
     """
+    if article_patterns is None:
+        return _is_article_url_default(url)
+
     if not is_valid_url(url):
         return False
 
-    # Default patterns for Swiss news sites
-    if article_patterns is None:
-        article_patterns = [
-            r"/article/",
-            r"/story/",
-            r"/news/",
-            r"/\d{4}/\d{2}/\d{2}/",  # Date patterns
-            r"/[a-z]+-[a-z]+-[a-z]+",  # Hyphenated titles
-            r"/\d+/",  # Article IDs
-        ]
+    # Custom patterns provided - only check these
+    url_lower = url.lower()
+    return any(
+        _compile_pattern(pattern).search(url_lower) for pattern in article_patterns
+    )
 
-        url_lower = url.lower()
 
-        # Check for article patterns
-        for pattern in article_patterns:
-            if re.search(pattern, url_lower):
-                return True
+@lru_cache(maxsize=4096)
+def _is_article_url_default(url: str) -> bool:
+    """Check a URL against the default Swiss news patterns (cached)."""
+    if not is_valid_url(url):
+        return False
 
-        # Exclude common non-article URLs (only for default patterns)
-        exclusion_patterns = [
-            r"/category/",
-            r"/tag/",
-            r"/author/",
-            r"/search",
-            r"/archive",
-            r"/feed",
-            r"/rss",
-            r"/sitemap",
-            r"/contact",
-            r"/about",
-            r"/impressum",
-            r"/datenschutz",
-        ]
+    # Patterns are case-insensitive, so the URL is matched as-is
+    # Check for article patterns
+    if _ARTICLE_RE.search(url):
+        return True
 
-        for pattern in exclusion_patterns:
-            if re.search(pattern, url_lower):
-                return False
+    # Exclude common non-article URLs (only for default patterns)
+    return not _EXCLUSION_RE.search(url)
 
-        return True
-    else:
-        # Custom patterns provided - only check these
-        url_lower = url.lower()
-        for pattern in article_patterns:
-            if re.search(pattern, url_lower):
-                return True
-        return False
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int = 0) -> Pattern[str]:
+    """Compile a caller-supplied pattern once, keeping its own groups and flags."""
+    return re.compile(pattern, flags)
 
 
 def parse_date_string(date_str: str) -> Optional[datetime]:
@@ -264,34 +396,70 @@ def parse_date_string(date_str: str) -> Optional[datetime]:
     if not date_str:
         return None
 
-    # Common date formats in Swiss news
-    date_formats = [
-        "%d.%m.%Y %H:%M",  # 01.01.2024 14:30
-        "%d.%m.%Y",  # 01.01.2024
-        "%Y-%m-%d %H:%M:%S",  # 2024-01-01 14:30:00
-        "%Y-%m-%d",  # 2024-01-01
-        "%d/%m/%Y",  # 01/01/2024
-        "%m/%d/%Y",  # 01/01/2024 (US format)
-    ]
-
-    # Clean the date string
-    date_str = clean_text(date_str)
+    # Date strings carry no entities or ads; only whitespace needs normalizing
+    date_str = _WS_RE.sub(" ", date_str).strip()
 
-    # Try parsing with each format
-    for fmt in date_formats:
+    # ISO-8601 date-times (e.g. from <time datetime>) are the most common format.
+    # Offsets are folded into naive UTC so results compare with datetime.now().
+    if _ISO_DATETIME_RE.match(date_str):
+        # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+        if date_str.endswith(("Z", "z")):
+            date_str = date_str[:-1] + "+00:00"
         try:
-            return datetime.strptime(date_str, fmt)
+            parsed = datetime.fromisoformat(date_str)
         except ValueError:
-            continue
+            pass
+        else:
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+            return parsed
+
+    # One match picks the format; no strptime attempts per candidate format
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
+        parsed = _date_from_match(match)
+        if parsed:
+            return parsed
 
     # Try parsing relative dates (German)
-    if any(word in date_str.lower() for word in ["vor", "minutes", "stunden", "heute"]):
+    if _RELATIVE_DATE_RE.search(date_str):
         return datetime.now()  # Approximate for relative dates (timezone-naive)
 
-    logger.warning(f"Could not parse date string: {date_str}")
+    logger.warning("Could not parse date string: {}", date_str)
     return None
 
 
+def _date_from_match(match: Match[str]) -> Optional[datetime]:
+    """Build a datetime from a _DATE_RE match, or None if it is out of range."""
+    groups = match.groupdict()
+    try:
+        if groups["year"]:
+            return datetime(
+                int(groups["year"]),
+                int(groups["month"]),
+                int(groups["day"]),
+                int(groups["hour"] or 0),
+                int(groups["minute"] or 0),
+            )
+        if groups["iso_year"]:
+            return datetime(
+                int(groups["iso_year"]),
+                int(groups["iso_month"]),
+                int(groups["iso_day"]),
+                int(groups["iso_hour"] or 0),
+                int(groups["iso_minute"] or 0),
+                int(groups["iso_second"] or 0),
+            )
+        first, second = int(groups["slash_a"]), int(groups["slash_b"])
+        year = int(groups["slash_year"])
+        try:
+            return datetime(year, second, first)
+        except ValueError:
+            return datetime(year, first, second)  # US format
+    except ValueError:
+        return None
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a string to be safe for use as a filename.
@@ -320,6 +488,7 @@ def sanitize_filename(filename: str) -> str:
     return filename or "untitled"
 
 
+@lru_cache(maxsize=4096)
 def get_language_from_url(url: str) -> Optional[str]:
     """
     Attempt to detect language from URL patterns.
@@ -333,28 +502,15 @@ def get_language_from_url(url: str) -> Optional[str]:
     if not url:
         return None
 
-    url_lower = url.lower()
-
     # Check for language in domain
-    if ".ch" in url_lower:
-        if any(domain in url_lower for domain in ["nzz.ch", "20min.ch", "srf.ch"]):
-            return "de"
-        elif any(domain in url_lower for domain in ["letemps.ch", "rts.ch", "tdg.ch"]):
-            return "fr"
-        elif any(
-            domain in url_lower for domain in ["cdt.ch", "rsi.ch", "laregione.ch"]
-        ):
-            return "it"
+    match = _LANGUAGE_DOMAIN_RE.search(url)
+    if match:
+        return _LANGUAGE_DOMAINS[match.group(0).lower()]
 
     # Check for language indicators in path
-    if "/de/" in url_lower or "/deutsch/" in url_lower:
-        return "de"
-    elif "/fr/" in url_lower or "/francais/" in url_lower:
-        return "fr"
-    elif "/it/" in url_lower or "/italiano/" in url_lower:
-        return "it"
-    elif "/rm/" in url_lower or "/romansh/" in url_lower:
-        return "rm"
+    match = _LANGUAGE_PATH_RE.search(url)
+    if match:
+        return _LANGUAGE_PATHS[match.group(1).lower()]
 
     return None
 
@@ -373,19 +529,21 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
 
-    # Simple word-based similarity
-    words1 = set(clean_text(text1).lower().split())
-    words2 = set(clean_text(text2).lower().split())
+    # Simple word-based similarity; tokenizing in the regex engine also
+    # drops punctuation, so full clean_text normalisation isn't needed
+    words1 = set(_WORD_RE.findall(text1.lower()))
+    words2 = set(_WORD_RE.findall(text2.lower()))
 
     if not words1 and not words2:
         return 1.0
     if not words1 or not words2:
         return 0.0
 
-    intersection = words1.intersection(words2)
-    union = words1.union(words2)
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never materialised
+    intersection = len(words1 & words2)
+    union = len(words1) + len(words2) - intersection
 
-    return len(intersection) / len(union) if union else 0.0
+    return intersection / union if union else 0.0
 
 
 def get_text_summary(text: str, max_length: int = 200) -> str:
@@ -404,20 +562,23 @@ def get_text_summary(text: str, max_length: int = 200) -> str:
 
     # Try to break at sentence boundaries
     sentences = re.split(r"[.!?]+", text)
-    summary = ""
+    parts = []
+    length = 0  # Length of the summary so far, counting each ". " separator
 
     for sentence in sentences:
         sentence = sentence.strip()
         if not sentence:
             continue
 
-        if len(summary + sentence) <= max_length - 3:  # Leave room for "..."
-            summary += sentence + ". "
-        else:
+        if length + len(sentence) > max_length - 3:  # Leave room for "..."
             break
+        parts.append(sentence)
+        length += len(sentence) + 2
+
+    summary = ". ".join(parts) + "." if parts else ""
 
-    if len(summary) < len(text):
-        summary = summary.rstrip() + "..."
+    if length < len(text):
+        summary += "..."
 
     return summary.strip()
 
@@ -432,18 +593,13 @@ def format_filesize(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    size = float(size_bytes)
-
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
+    # Each unit spans 10 bits, so the bit length picks the unit directly
+    i = min((size_bytes.bit_length() - 1) // 10, _MAX_SIZE_UNIT)
 
-    return f"{size:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 def log_scraping_stats(stats: Dict[str, Any]) -> None:
@@ -463,12 +619,16 @@ def log_scraping_stats(stats: Dict[str, Any]) -> None:
         (articles_scraped / articles_found * 100) if articles_found > 0 else 0
     )
 
+    # Loguru formats the arguments only if the record is actually emitted
     logger.info(
-        f"Scraping completed for '{outlet}': "
-        f"{articles_scraped}/{articles_found} articles scraped "
-        f"({success_rate:.1f}% success rate), "
-        f"{errors} errors, "
-        f"duration: {duration:.2f}s"
+        "Scraping completed for '{}': {}/{} articles scraped "
+        "({:.1f}% success rate), {} errors, duration: {:.2f}s",
+        outlet,
+        articles_scraped,
+        articles_found,
+        success_rate,
+        errors,
+        duration,
     )
 
 
@@ -502,7 +662,7 @@ def advanced_clean_text(
     if outlet_config and "text_processing" in outlet_config:
         remove_patterns = outlet_config["text_processing"].get("remove_patterns", [])
         for pattern in remove_patterns:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+            text = _compile_pattern(pattern, re.IGNORECASE).sub("", text)
 
     # Advanced HTML artifact cleaning
     text = clean_html_artifacts(text)
@@ -527,40 +687,7 @@ def remove_ad_content(text: str, language: str) -> str:
     if not text:
         return ""
 
-    ad_patterns = {
-        "de": [
-            r"\[Werbung\]",
-            r"\(Anzeige\)",
-            r"\(Werbung\)",
-            r"Anzeige\s*:",
-            r"Sponsored\s*:",
-            r"Partner-Inhalte?",
-            r"Werbliche\s+Inhalte?",
-        ],
-        "fr": [
-            r"\[Publicité\]",
-            r"\(Publicité\)",
-            r"Publicité\s*:",
-            r"Contenu\s+sponsorisé",
-            r"Partenaire\s*:",
-            r"Sponsored\s*:",
-        ],
-        "it": [
-            r"\[Pubblicità\]",
-            r"\(Pubblicità\)",
-            r"Pubblicità\s*:",
-            r"Contenuto\s+sponsorizzato",
-            r"Partner\s*:",
-            r"Sponsored\s*:",
-        ],
-    }
-
-    patterns = ad_patterns.get(language, ad_patterns["de"])
-
-    for pattern in patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-    return text
+    return _AD_PATTERNS.get(language, _AD_PATTERNS["de"]).sub("", text)
 
 
 def clean_html_artifacts(text: str) -> str:
@@ -576,43 +703,34 @@ def clean_html_artifacts(text: str) -> str:
     if not text:
         return ""
 
-    # Extended HTML entity handling
-    html_entities = {
-        "&nbsp;": " ",
-        "&amp;": "&",
-        "&lt;": "<",
-        "&gt;": ">",
-        "&quot;": '"',
-        "&apos;": "'",
-        "&#39;": "'",
-        "&hellip;": "...",
-        "&mdash;": "—",
-        "&ndash;": "–",
-        "&laquo;": "«",
-        "&raquo;": "»",
-        "&ldquo;": """,
-        "&rdquo;": """,
-        "&lsquo;": "'",
-        "&rsquo;": "'",
-    }
-
-    for entity, replacement in html_entities.items():
-        text = text.replace(entity, replacement)
+    # Decode named and numeric entities, keeping the ASCII forms for ellipses
+    # and single quotes; literal characters in the text are left as they are
+    if "&" in text:
+        text = _ANY_ENTITY_RE.sub(_decode_entity, text)
 
     # Remove remaining HTML entities
-    text = re.sub(r"&[a-zA-Z][a-zA-Z0-9]*;", " ", text)
-    text = re.sub(r"&#\d+;", " ", text)
-    text = re.sub(r"&#x[0-9a-fA-F]+;", " ", text)
+    text = _ANY_ENTITY_RE.sub(" ", text)
 
     # Remove HTML tags if any remain
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = _TAG_RE.sub(" ", text)
 
     # Clean up whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WS_RE.sub(" ", text)
 
     return text.strip()
 
 
+@lru_cache(maxsize=512)
+def _unescape_entity(entity: str) -> str:
+    """Decode one entity, folding ellipses and single quotes to ASCII (cached)."""
+    return html.unescape(entity).translate(_ASCII_PUNCTUATION)
+
+
+def _decode_entity(match: Match[str]) -> str:
+    """re.sub callback decoding the matched entity."""
+    return _unescape_entity(match.group())
+
+
 def handle_special_characters(text: str, language: str) -> str:
     """
     Handle special characters specific to Swiss languages.
@@ -643,7 +761,7 @@ def handle_special_characters(text: str, language: str) -> str:
         pass  # Keep Italian accents
 
     # Remove problematic characters that might cause encoding issues
-    text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]", "", text)
+    text = _CONTROL_CHARS_RE.sub("", text)
 
     return text
 
@@ -724,94 +842,68 @@ def validate_article_content(content: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Validation result with score and issues
     """
-    validation: Dict[str, Any] = {
-        "is_valid": True,
-        "score": 0.0,
-        "issues": [],
-        "completeness": 0.0,
-    }
+    is_valid = True
+    score = 0.0
+    issues: List[str] = []
 
-    required_fields = ["title", "body_paragraphs", "url"]
-    optional_fields = ["author", "publication_date", "tags", "images"]
+    required_fields = ("title", "body_paragraphs", "url")
+    optional_fields = ("author", "publication_date", "tags", "images")
 
-    # Check required fields
+    # Check required fields and count present fields in a single pass
     missing_required = []
-    for field in required_fields:
-        if not content.get(field):
-            missing_required.append(field)
-
-    if missing_required:
-        validation["is_valid"] = False
-        issues_list = validation["issues"]
-        if isinstance(issues_list, list):
-            issues_list.append(
-                f"Missing required fields: {', '.join(missing_required)}"
-            )
-
-    # Calculate completeness score
-    total_fields = len(required_fields) + len(optional_fields)
     present_fields = 0
 
     for field in required_fields + optional_fields:
-        field_value = content.get(field)
-        if field_value:
-            if isinstance(field_value, list) and len(field_value) > 0:
-                present_fields += 1
-            elif isinstance(field_value, str) and field_value.strip():
-                present_fields += 1
-            elif field_value:  # For other types like datetime
-                present_fields += 1
+        if content.get(field):
+            present_fields += 1
+        elif field in required_fields:
+            missing_required.append(field)
+
+    if missing_required:
+        is_valid = False
+        issues.append(f"Missing required fields: {', '.join(missing_required)}")
 
-    validation["completeness"] = present_fields / total_fields
+    completeness = present_fields / (len(required_fields) + len(optional_fields))
 
     # Content quality checks
-    if content.get("body_paragraphs"):
-        paragraphs = content["body_paragraphs"]
-        issues_list = validation["issues"]
-        score = validation["score"]
-
-        if isinstance(paragraphs, list) and len(paragraphs) < 2:
-            if isinstance(issues_list, list):
-                issues_list.append("Article has very few paragraphs")
-
-        if isinstance(paragraphs, list):
-            total_words = sum(len(str(p).split()) for p in paragraphs)
-            if total_words < 50:  # Reduced threshold for "very short"
-                if isinstance(issues_list, list):
-                    issues_list.append("Article content is very short")
-                if isinstance(score, (int, float)):
-                    validation["score"] = score - 0.2
-            elif total_words > 2000:
-                if isinstance(score, (int, float)):
-                    validation["score"] = score + 0.1  # Bonus for substantial content
+    paragraphs = content.get("body_paragraphs")
+    if paragraphs and isinstance(paragraphs, list):
+        if len(paragraphs) < 2:
+            issues.append("Article has very few paragraphs")
+
+        # Count separators rather than splitting, to avoid a list per paragraph
+        total_words = sum(
+            p.count(" ") + 1 for p in paragraphs if isinstance(p, str) and p
+        )
+        if total_words < 50:  # Reduced threshold for "very short"
+            issues.append("Article content is very short")
+            score -= 0.2
+        elif total_words > 2000:
+            score += 0.1  # Bonus for substantial content
 
     # Title quality check
-    if content.get("title"):
-        title = content["title"]
-        issues_list = validation["issues"]
-        if isinstance(title, str):
-            title_length = len(title)
-            if title_length < 10:
-                if isinstance(issues_list, list):
-                    issues_list.append("Title is very short")
-            elif title_length > 200:
-                if isinstance(issues_list, list):
-                    issues_list.append("Title is unusually long")
+    title = content.get("title")
+    if title and isinstance(title, str):
+        title_length = len(title)
+        if title_length < 10:
+            issues.append("Title is very short")
+        elif title_length > 200:
+            issues.append("Title is unusually long")
 
     # Calculate overall score
-    base_score = validation["completeness"]
-    current_score = validation["score"]
-    if isinstance(base_score, (int, float)) and isinstance(current_score, (int, float)):
-        validation["score"] = max(0.0, min(1.0, base_score + current_score))
+    score = max(0.0, min(1.0, completeness + score))
 
     # Final validation
-    final_score = validation["score"]
-    if isinstance(final_score, (int, float)) and final_score < 0.3:
-        validation["is_valid"] = False
-        issues_list = validation["issues"]
-        if isinstance(issues_list, list):
-            issues_list.append("Overall content quality is too low")
+    if score < 0.3:
+        is_valid = False
+        issues.append("Overall content quality is too low")
 
+    validation: Dict[str, Any] = {
+        "is_valid": is_valid,
+        "score": score,
+        "issues": issues,
+        "completeness": completeness,
+    }
     return validation
 
 
@@ -923,6 +1015,14 @@ def detect_content_quality(content: str) -> float:
     return min(1.0, score)
 
 
+@lru_cache(maxsize=1024)
+def _is_valid_author_name(author: str) -> bool:
+    """Check an author name against the allowed character set (cached)."""
+    if author.isascii():
+        return bool(_AUTHOR_ASCII_RE.match(author.encode("ascii")))
+    return bool(_AUTHOR_UNICODE_RE.match(author))
+
+
 def validate_metadata_consistency(metadata: Dict[str, Any]) -> bool:
     """
     Validate that extracted metadata is consistent and reasonable.
@@ -955,7 +1055,7 @@ def validate_metadata_consistency(metadata: Dict[str, Any]) -> bool:
         if len(author) < 2 or len(author) > 100:
             return False
         # Check for reasonable author format
-        if not re.match(r"^[A-Za-zÀ-ÿĀ-žА-я\s\-\.\']+$", author):
+        if not _is_valid_author_name(author):
             return False
 
     # Tags consistency check
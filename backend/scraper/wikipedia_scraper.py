@@ -16,7 +16,9 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +26,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Citations like [1] and the dagger markers Wikipedia uses for footnotes
+_WIKI_ARTIFACTS_RE = re.compile(r"\[\d+\]|[†‡]")
+_WS_RE = re.compile(r"\s+")
+
+# Outlet tables carry the "wikitable" class, usually alongside others
+_WIKITABLE_RE = re.compile(r"\bwikitable\b")
+
 
 class SwissNewsWikipediaScraper:
     def __init__(self) -> None:
@@ -31,6 +40,19 @@ class SwissNewsWikipediaScraper:
             "https://en.wikipedia.org/wiki/List_of_newspapers_in_Switzerland"
         )
         self.session = requests.Session()
+        # Retry transient server errors inside urllib3, reusing pooled
+        # keep-alive connections instead of sleeping in Python
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.0,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": "Swiss News Aggregator Research Bot (https://github.com/devpouya/swissnews)"
@@ -45,7 +67,13 @@ class SwissNewsWikipediaScraper:
         try:
             response = self.session.get(self.base_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
+            # lxml parses in C and is much faster than the pure-Python parser;
+            # only the outlet tables are turned into a tree
+            soup = BeautifulSoup(
+                response.content,
+                "lxml",
+                parse_only=SoupStrainer("table", attrs={"class": _WIKITABLE_RE}),
+            )
             logger.info("Successfully fetched Wikipedia page")
             return soup
         except requests.RequestException as e:
@@ -100,24 +128,17 @@ class SwissNewsWikipediaScraper:
                 "occurrence": "",
             }
 
+            # Extract and clean each cell's text once per row
+            texts = [self.clean_text(cell.get_text()) for cell in cells]
+
             # Extract name (always in first column typically)
-            if cells:
-                name_cell = cells[0]
-                outlet["news_website"] = self.clean_text(name_cell.get_text())
+            outlet["news_website"] = texts[0]
 
-            # Extract other fields based on column mapping
+            # Extract other fields based on column mapping; "name" and
+            # "established" have no outlet field of their own
             for field, col_index in column_map.items():
-                if col_index < len(cells) and field != "name":
-                    if field == "owner":
-                        outlet["owner"] = self.clean_text(cells[col_index].get_text())
-                    elif field == "city":
-                        outlet["city"] = self.clean_text(cells[col_index].get_text())
-                    elif field == "canton":
-                        outlet["canton"] = self.clean_text(cells[col_index].get_text())
-                    elif field == "occurrence":
-                        outlet["occurrence"] = self.clean_text(
-                            cells[col_index].get_text()
-                        )
+                if field in outlet and col_index < len(texts):
+                    outlet[field] = texts[col_index]
 
             # Skip if no meaningful name
             if outlet["news_website"] and len(outlet["news_website"]) > 1:
@@ -130,16 +151,10 @@ class SwissNewsWikipediaScraper:
         if not text:
             return ""
 
-        # Remove citations like [1], [2], etc.
-        text = re.sub(r"\[\d+\]", "", text)
+        # Remove citations and footnote markers, then normalize whitespace
+        text = _WIKI_ARTIFACTS_RE.sub("", text)
 
-        # Remove extra whitespace
-        text = " ".join(text.split())
-
-        # Remove common Wikipedia artifacts
-        text = text.replace("†", "").replace("‡", "")
-
-        return text.strip()
+        return _WS_RE.sub(" ", text).strip()
 
     def scrape_all_languages(self) -> List[Dict]:
         """Scrape outlets from all language sections."""
@@ -218,10 +233,17 @@ class SwissNewsWikipediaScraper:
             "status",
         ]
 
+        # Build rows in field order up front; csv.writer then skips the
+        # per-row key validation and dict conversion DictWriter does
+        rows = [
+            tuple(outlet.get(field, "") for field in fieldnames)
+            for outlet in self.outlets
+        ]
+
         with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.outlets)
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
 
         logger.info(f"Successfully saved outlets to {filename}")
 
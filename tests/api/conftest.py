@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the API contract tests.
+
+A single pooled HTTP client is shared by the whole test session so that
+keep-alive connections are reused instead of reconnecting for every test.
+
+Set PYTEST_USE_MOCK=1 to serve requests from an in-process fake of the API
+(via httpx.MockTransport) instead of a live server at BASE_URL. Without
+it, the tests are skipped when no server is listening at BASE_URL.
+"""
+
+import json
+import os
+import re
+
+import httpx
+import pytest
+import pytest_asyncio
+
+BASE_URL = "http://localhost:8000"
+
+USE_MOCK = os.environ.get("PYTEST_USE_MOCK") == "1"
+
+MOCK_ARTICLES = [
+    {
+        "id": "1",
+        "title": "Bundesrat beschliesst neue Klimastrategie",
+        "url": "https://www.nzz.ch/schweiz/klimastrategie-ld.1",
+        "content": "Der Bundesrat hat eine neue Klimastrategie verabschiedet.",
+        "summary": "Neue Klimastrategie des Bundesrats.",
+        "author": "Hans Mueller",
+        "publish_date": "2024-01-15T10:00:00",
+        "language": "de",
+        "outlet": "NZZ",
+    },
+    {
+        "id": "2",
+        "title": "Le Conseil fédéral adopte une stratégie climatique",
+        "url": "https://www.letemps.ch/suisse/strategie-climatique",
+        "content": "Le Conseil fédéral a adopté une nouvelle stratégie climatique.",
+        "summary": "Nouvelle stratégie climatique.",
+        "author": "Marie Dubois",
+        "publish_date": "2024-01-15T11:00:00",
+        "language": "fr",
+        "outlet": "Le Temps",
+    },
+]
+
+MOCK_OUTLETS = [
+    {"id": "1", "name": "NZZ", "language": "de"},
+    {"id": "2", "name": "Le Temps", "language": "fr"},
+    {"id": "3", "name": "Corriere del Ticino", "language": "it"},
+]
+
+_ARTICLE_PATH_RE = re.compile(r"^/api/articles/(?P<id>[^/]+)(?P<similar>/similar)?$")
+
+
+def _unwrap_list(data, *keys):
+    """Return the list payload, bare or under the first matching key"""
+    if isinstance(data, list):
+        return data
+    for key in keys:
+        if key in data:
+            return data[key]
+    return data
+
+
+@pytest.fixture(scope="session")
+def unwrap_list():
+    """Helper that unwraps list payloads returned bare or under a key"""
+    return _unwrap_list
+
+
+def _translate(request: httpx.Request) -> httpx.Response:
+    """Echo a translation request back with the target language prefixed"""
+    try:
+        payload = json.loads(request.content)
+    except ValueError:
+        return httpx.Response(400, json={"error": "Invalid JSON body"})
+    return httpx.Response(
+        200,
+        json={
+            "translated_text": f"[{payload['target_language']}] {payload['text']}",
+            "source_language": payload["source_language"],
+            "target_language": payload["target_language"],
+        },
+    )
+
+
+def _list_articles(request: httpx.Request) -> httpx.Response:
+    """Serve one page of the mock articles"""
+    page = int(request.url.params.get("page", 1))
+    limit = int(request.url.params.get("limit", 20))
+    start = (page - 1) * limit
+    return httpx.Response(
+        200,
+        json={
+            "articles": MOCK_ARTICLES[start : start + limit],
+            "page": page,
+            "limit": limit,
+            "total": len(MOCK_ARTICLES),
+        },
+    )
+
+
+def _search_articles(request: httpx.Request) -> httpx.Response:
+    """Serve mock articles whose content contains the query"""
+    query = request.url.params.get("q", "").lower()
+    results = [a for a in MOCK_ARTICLES if query in a["content"].lower()]
+    return httpx.Response(200, json={"results": results})
+
+
+def _list_outlets(request: httpx.Request) -> httpx.Response:
+    """Serve the mock outlets"""
+    return httpx.Response(200, json={"outlets": MOCK_OUTLETS})
+
+
+def _article_detail(match: re.Match) -> httpx.Response:
+    """Serve one mock article, or the articles similar to it"""
+    article_id = match.group("id")
+    article = next((a for a in MOCK_ARTICLES if a["id"] == article_id), None)
+    if article is None:
+        return httpx.Response(404, json={"error": "Article not found"})
+    if match.group("similar"):
+        similar = [a for a in MOCK_ARTICLES if a["id"] != article_id]
+        return httpx.Response(200, json={"similar": similar})
+    return httpx.Response(200, json=article)
+
+
+_GET_ROUTES = {
+    "/api/articles": _list_articles,
+    "/api/articles/search": _search_articles,
+    "/api/outlets": _list_outlets,
+}
+
+
+def _mock_api(request: httpx.Request) -> httpx.Response:
+    """Serve API requests from in-memory fixtures"""
+    path = request.url.path
+
+    if request.method == "POST" and path == "/api/translate":
+        return _translate(request)
+
+    if request.method != "GET":
+        return httpx.Response(405, json={"error": "Method not allowed"})
+
+    if path in _GET_ROUTES:
+        return _GET_ROUTES[path](request)
+
+    match = _ARTICLE_PATH_RE.match(path)
+    if match:
+        return _article_detail(match)
+
+    return httpx.Response(404, json={"error": "Not found"})
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Session-wide HTTP client for API testing"""
+    with httpx.Client(
+        base_url=BASE_URL,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=httpx.Timeout(10.0),
+        transport=httpx.MockTransport(_mock_api) if USE_MOCK else None,
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _require_api(api_client):
+    """Skip the API tests once, up front, when no server is listening"""
+    if USE_MOCK:
+        return
+    try:
+        # Fail fast on connect, but give a running server the usual read timeout
+        api_client.get("/api/articles", timeout=httpx.Timeout(10.0, connect=1.0))
+    except httpx.TransportError as e:
+        pytest.skip(f"API server not reachable at {BASE_URL}: {e!r}")
+
+
+@pytest_asyncio.fixture
+async def async_api_client():
+    """Async HTTP client for concurrent request tests"""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        limits=httpx.Limits(max_connections=20),
+        timeout=httpx.Timeout(10.0),
+        transport=httpx.MockTransport(_mock_api) if USE_MOCK else None,
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sample_article_id(api_client):
+    """ID of an existing article, fetched once per session"""
+    response = api_client.get("/api/articles")
+    if response.status_code != 200:
+        pytest.skip("Articles endpoint not available")
+
+    data = response.json()
+    articles = _unwrap_list(data, "articles")
+    if not articles:
+        pytest.skip("No articles available")
+
+    return articles[0]["id"]
@@ -9,37 +9,77 @@ Author: Claude (GitHub Issue #2)
 Created: 2025-08-04
 """
 
+import ast
+import csv
 import unittest
 import os
 import sys
 import tempfile
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 # Add backend directory to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root / 'backend'))
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_DIR = PROJECT_ROOT / 'backend'
+DATABASE_DIR = BACKEND_DIR / 'database'
+MIGRATIONS_DIR = DATABASE_DIR / 'migrations'
+
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+# Import once, keeping the populate script off the real database manager
+with patch('database.connection.db_manager'):
+    from database.populate_outlets import (
+        clean_outlet_data,
+        load_outlets_from_csv,
+        normalize_language_code,
+    )
+
+
+@lru_cache(maxsize=None)
+def _parse_file(path):
+    """Parse a Python source file once; raises SyntaxError if invalid."""
+    return ast.parse(Path(path).read_text(encoding='utf-8'), filename=path)
+
 
 class TestDatabaseSchema(unittest.TestCase):
     """Test database schema without requiring actual database connection"""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.project_root = Path(__file__).parent.parent.parent
-        self.backend_dir = self.project_root / 'backend'
-        self.database_dir = self.backend_dir / 'database'
-        self.migrations_dir = self.database_dir / 'migrations'
-        self.migration_file = self.migrations_dir / '001_initial_schema.sql'
-        self.init_file = self.database_dir / 'init.sql'
-        self.connection_file = self.database_dir / 'connection.py'
-        self.populate_file = self.database_dir / 'populate_outlets.py'
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures, reading each schema file once per class."""
+        cls.migration_file = MIGRATIONS_DIR / '001_initial_schema.sql'
+        cls.init_file = DATABASE_DIR / 'init.sql'
+        cls.connection_file = DATABASE_DIR / 'connection.py'
+        cls.populate_file = DATABASE_DIR / 'populate_outlets.py'
+
+        cls.migration_content = cls._read_if_exists(cls.migration_file)
+        cls.init_content = cls._read_if_exists(cls.init_file)
+
+    @staticmethod
+    def _read_if_exists(path):
+        """Read a file, or return None so the existence tests report it."""
+        if not path.exists():
+            return None
+        return path.read_text(encoding='utf-8')
+
+    def _require_text(self, content, path):
+        """Return a schema file's text, failing with a readable message if missing."""
+        self.assertIsNotNone(content, f"Schema file should exist at {path}")
+        return content
+
+    @staticmethod
+    def _missing_literals(content, literals):
+        """Return the literals not found anywhere in content."""
+        return [literal for literal in literals if literal not in content]
 
     def test_database_directory_structure(self):
         """Test that database directory structure exists."""
-        self.assertTrue(self.database_dir.exists(),
+        self.assertTrue(DATABASE_DIR.exists(),
                        "Database directory should exist")
-        self.assertTrue(self.migrations_dir.exists(),
+        self.assertTrue(MIGRATIONS_DIR.exists(),
                        "Migrations directory should exist")
 
     def test_migration_file_exists(self):
@@ -64,8 +104,7 @@ class TestDatabaseSchema(unittest.TestCase):
 
     def test_migration_sql_syntax(self):
         """Test basic SQL syntax validation of migration file."""
-        with open(self.migration_file, 'r', encoding='utf-8') as file:
-            content = file.read()
+        content = self._require_text(self.migration_content, self.migration_file)
 
         # Check for balanced parentheses
         paren_count = content.count('(') - content.count(')')
@@ -87,8 +126,7 @@ class TestDatabaseSchema(unittest.TestCase):
 
     def test_migration_contains_required_elements(self):
         """Test that migration contains all required database elements."""
-        with open(self.migration_file, 'r', encoding='utf-8') as file:
-            content = file.read()
+        content = self._require_text(self.migration_content, self.migration_file)
 
         required_elements = [
             # Tables
@@ -117,23 +155,21 @@ class TestDatabaseSchema(unittest.TestCase):
             'UNIQUE NOT NULL'
         ]
 
-        for element in required_elements:
-            self.assertIn(element, content, f"Missing required element: {element}")
+        missing = self._missing_literals(content, required_elements)
+        self.assertEqual(missing, [], f"Missing required elements: {missing}")
 
     def test_schema_supports_multilingual_content(self):
         """Test that schema supports Swiss multilingual content."""
-        with open(self.migration_file, 'r', encoding='utf-8') as file:
-            content = file.read()
+        content = self._require_text(self.migration_content, self.migration_file)
 
         # Check language constraints
-        swiss_languages = ['de', 'fr', 'it', 'rm']
-        for lang in swiss_languages:
-            self.assertIn(f"'{lang}'", content, f"Missing support for language: {lang}")
+        swiss_languages = ["'de'", "'fr'", "'it'", "'rm'"]
+        missing = self._missing_literals(content, swiss_languages)
+        self.assertEqual(missing, [], f"Missing support for languages: {missing}")
 
     def test_schema_has_performance_indexes(self):
         """Test that schema includes performance-oriented indexes."""
-        with open(self.migration_file, 'r', encoding='utf-8') as file:
-            content = file.read()
+        content = self._require_text(self.migration_content, self.migration_file)
 
         # Count indexes
         index_count = content.count('CREATE INDEX')
@@ -148,34 +184,27 @@ class TestDatabaseSchema(unittest.TestCase):
             'tags'  # Tag array indexes
         ]
 
-        for index_type in performance_indexes:
-            self.assertIn(index_type, content, f"Missing performance index: {index_type}")
+        missing = self._missing_literals(content, performance_indexes)
+        self.assertEqual(missing, [], f"Missing performance indexes: {missing}")
 
     def test_connection_utilities_syntax(self):
         """Test that connection utilities file is syntactically valid."""
-        # Test by attempting to compile the file
-        with open(self.connection_file, 'r', encoding='utf-8') as file:
-            content = file.read()
-
+        # Test by attempting to parse the file
         try:
-            compile(content, str(self.connection_file), 'exec')
+            _parse_file(str(self.connection_file))
         except SyntaxError as e:
             self.fail(f"Connection utilities file has syntax error: {e}")
 
     def test_populate_script_syntax(self):
         """Test that populate script is syntactically valid."""
-        with open(self.populate_file, 'r', encoding='utf-8') as file:
-            content = file.read()
-
         try:
-            compile(content, str(self.populate_file), 'exec')
+            _parse_file(str(self.populate_file))
         except SyntaxError as e:
             self.fail(f"Populate script has syntax error: {e}")
 
     def test_init_script_references_migration(self):
         """Test that init script properly references migration file."""
-        with open(self.init_file, 'r', encoding='utf-8') as file:
-            content = file.read()
+        content = self._require_text(self.init_content, self.init_file)
 
         # Should reference the migration file
         self.assertIn('001_initial_schema.sql', content)
@@ -183,45 +212,27 @@ class TestDatabaseSchema(unittest.TestCase):
 
     def test_schema_has_sample_data(self):
         """Test that schema includes sample data for testing."""
-        with open(self.migration_file, 'r', encoding='utf-8') as file:
-            content = file.read()
-
-        # Should have sample outlets and articles
-        self.assertIn('INSERT INTO outlets', content)
-        self.assertIn('INSERT INTO articles', content)
-
-        # Should have outlets in different languages
-        self.assertIn("'de'", content)  # German
-        self.assertIn("'fr'", content)  # French
-        self.assertIn("'it'", content)  # Italian
-        self.assertIn("'rm'", content)  # Romansh
+        content = self._require_text(self.migration_content, self.migration_file)
+
+        expected = [
+            # Should have sample outlets and articles
+            'INSERT INTO outlets',
+            'INSERT INTO articles',
+            # Should have outlets in different languages
+            "'de'",  # German
+            "'fr'",  # French
+            "'it'",  # Italian
+            "'rm'",  # Romansh
+        ]
+        missing = self._missing_literals(content, expected)
+        self.assertEqual(missing, [], f"Missing sample data: {missing}")
 
 
+# Every test runs against an empty environment, restored afterwards in one swap
+@patch.dict(os.environ, {}, clear=True)
 class TestDatabaseConfiguration(unittest.TestCase):
     """Test database configuration and connection utilities"""
 
-    def setUp(self):
-        """Set up test fixtures with mocked environment."""
-        # Clear any existing environment variables
-        self.env_vars = [
-            'DB_HOST', 'DB_PORT', 'DB_NAME', 'DB_USER', 'DB_PASSWORD',
-            'DB_SSL_MODE', 'DB_POOL_SIZE', 'DB_MAX_OVERFLOW',
-            'DB_POOL_TIMEOUT', 'DB_POOL_RECYCLE'
-        ]
-        self.original_env = {}
-        for var in self.env_vars:
-            self.original_env[var] = os.environ.get(var)
-            if var in os.environ:
-                del os.environ[var]
-
-    def tearDown(self):
-        """Restore original environment."""
-        for var, value in self.original_env.items():
-            if value is not None:
-                os.environ[var] = value
-            elif var in os.environ:
-                del os.environ[var]
-
     @patch('psycopg2.connect')
     @patch('sqlalchemy.create_engine')
     def test_database_config_defaults(self, mock_engine, mock_connect):
@@ -240,18 +251,18 @@ class TestDatabaseConfiguration(unittest.TestCase):
         self.assertEqual(config.ssl_mode, 'prefer')
         self.assertEqual(config.pool_size, 5)
 
+    @patch.dict(os.environ, {
+        'DB_HOST': 'testhost',
+        'DB_PORT': '5433',
+        'DB_NAME': 'testdb',
+        'DB_USER': 'testuser',
+        'DB_PASSWORD': 'testpass',
+        'DB_POOL_SIZE': '10',
+    })
     @patch('psycopg2.connect')
     @patch('sqlalchemy.create_engine')
     def test_database_config_environment_variables(self, mock_engine, mock_connect):
         """Test database configuration with environment variables."""
-        # Set environment variables
-        os.environ['DB_HOST'] = 'testhost'
-        os.environ['DB_PORT'] = '5433'
-        os.environ['DB_NAME'] = 'testdb'
-        os.environ['DB_USER'] = 'testuser'
-        os.environ['DB_PASSWORD'] = 'testpass'
-        os.environ['DB_POOL_SIZE'] = '10'
-
         from database.connection import DatabaseConfig
 
         config = DatabaseConfig()
@@ -283,14 +294,12 @@ class TestDatabaseConfiguration(unittest.TestCase):
 class TestCSVIntegration(unittest.TestCase):
     """Test CSV to database integration"""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.project_root = Path(__file__).parent.parent.parent
-        self.data_dir = self.project_root / 'data'
-
+    @classmethod
+    def setUpClass(cls):
+        """Set up a read-only CSV fixture shared by the class."""
         # Create temporary CSV for testing
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.test_csv = self.temp_dir / 'test_outlets.csv'
+        cls.temp_dir = Path(tempfile.mkdtemp())
+        cls.test_csv = cls.temp_dir / 'test_outlets.csv'
 
         # Create sample CSV data
         csv_data = [
@@ -299,64 +308,56 @@ class TestCSVIntegration(unittest.TestCase):
             ['Test Outlet 2', 'https://test2.ch', 'French', 'Test Owner 2', 'Geneva', 'Geneva', 'Weekly', 'current']
         ]
 
-        with open(self.test_csv, 'w', newline='', encoding='utf-8') as file:
-            import csv
+        with open(cls.test_csv, 'w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             writer.writerows(csv_data)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary files."""
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir)
 
     def test_csv_data_transformation(self):
         """Test CSV data transformation logic."""
-        import sys
-        sys.path.append(str(self.project_root / 'backend'))
-
-        # Import without actually connecting to database
-        with patch('database.connection.db_manager'):
-            from database.populate_outlets import clean_outlet_data, normalize_language_code
-
-            # Test language normalization
-            self.assertEqual(normalize_language_code('German'), 'de')
-            self.assertEqual(normalize_language_code('French'), 'fr')
-            self.assertEqual(normalize_language_code('Italian'), 'it')
-            self.assertEqual(normalize_language_code('Romansch'), 'rm')
-
-            # Test data cleaning
-            test_row = {
-                'news_website': 'Test Outlet',
-                'url': 'https://test.ch',
-                'original_language': 'German',
-                'owner': 'Test Owner',
-                'city': 'Zurich',
-                'canton': 'Zurich',
-                'occurrence': 'Daily',
-                'status': 'current'
-            }
-
-            cleaned = clean_outlet_data(test_row)
-
-            self.assertEqual(cleaned['name'], 'Test Outlet')
-            self.assertEqual(cleaned['language'], 'de')
-            self.assertEqual(cleaned['url'], 'https://test.ch')
-            self.assertEqual(cleaned['status'], 'current')
+        # Test language normalization
+        language_codes = [
+            ('German', 'de'),
+            ('French', 'fr'),
+            ('Italian', 'it'),
+            ('Romansch', 'rm'),
+        ]
+        for name, code in language_codes:
+            with self.subTest(language=name):
+                self.assertEqual(normalize_language_code(name), code)
+
+        # Test data cleaning
+        test_row = {
+            'news_website': 'Test Outlet',
+            'url': 'https://test.ch',
+            'original_language': 'German',
+            'owner': 'Test Owner',
+            'city': 'Zurich',
+            'canton': 'Zurich',
+            'occurrence': 'Daily',
+            'status': 'current'
+        }
+
+        cleaned = clean_outlet_data(test_row)
+
+        self.assertEqual(cleaned['name'], 'Test Outlet')
+        self.assertEqual(cleaned['language'], 'de')
+        self.assertEqual(cleaned['url'], 'https://test.ch')
+        self.assertEqual(cleaned['status'], 'current')
 
     def test_csv_loading(self):
         """Test loading outlets from CSV file."""
-        import sys
-        sys.path.append(str(self.project_root / 'backend'))
-
-        with patch('database.connection.db_manager'):
-            from database.populate_outlets import load_outlets_from_csv
+        outlets = load_outlets_from_csv(str(self.test_csv))
 
-            outlets = load_outlets_from_csv(str(self.test_csv))
-
-            self.assertEqual(len(outlets), 2)
-            self.assertEqual(outlets[0]['name'], 'Test Outlet 1')
-            self.assertEqual(outlets[0]['language'], 'de')
-            self.assertEqual(outlets[1]['name'], 'Test Outlet 2')
-            self.assertEqual(outlets[1]['language'], 'fr')
+        self.assertEqual(len(outlets), 2)
+        self.assertEqual(outlets[0]['name'], 'Test Outlet 1')
+        self.assertEqual(outlets[0]['language'], 'de')
+        self.assertEqual(outlets[1]['name'], 'Test Outlet 2')
+        self.assertEqual(outlets[1]['language'], 'fr')
 
 
 class TestSchemaValidation(unittest.TestCase):
@@ -364,17 +365,13 @@ class TestSchemaValidation(unittest.TestCase):
 
     def test_schema_validation_script_exists(self):
         """Test that schema validation script exists and works."""
-        project_root = Path(__file__).parent.parent.parent
-        test_script = project_root / 'backend' / 'database' / 'test_schema.py'
+        test_script = DATABASE_DIR / 'test_schema.py'
 
         self.assertTrue(test_script.exists(), "Schema test script should exist")
 
         # Test that script is syntactically valid
-        with open(test_script, 'r', encoding='utf-8') as file:
-            content = file.read()
-
         try:
-            compile(content, str(test_script), 'exec')
+            _parse_file(str(test_script))
         except SyntaxError as e:
             self.fail(f"Schema test script has syntax error: {e}")
 
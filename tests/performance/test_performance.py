@@ -12,6 +12,8 @@ import statistics
 from typing import List
 import asyncio
 import psycopg2
+from array import array
+from psycopg2.pool import ThreadedConnectionPool
 from unittest.mock import patch
 import sys
 import os
@@ -19,40 +21,57 @@ import os
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../backend'))
 
+# Timings use the monotonic time.perf_counter_ns() and are compared in ns
+NS_PER_S = 1_000_000_000
 
+DB_PARAMS = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': os.getenv('DB_PORT', 5432),
+    'database': os.getenv('DB_NAME', 'swissnews_test'),
+    'user': os.getenv('DB_USER', 'postgres'),
+    'password': os.getenv('DB_PASSWORD', 'postgres'),
+}
+
+
+def _probe_db() -> bool:
+    """Return whether the test database accepts connections"""
+    try:
+        psycopg2.connect(connect_timeout=1, **DB_PARAMS).close()
+    except psycopg2.Error:
+        return False
+    return True
+
+
+# Probed once at import so an absent database costs one connect attempt
+_HAS_DB = _probe_db()
+
+
+@pytest.fixture(scope="class")
+def db_connection():
+    """Database connection shared by the whole class"""
+    conn = psycopg2.connect(**DB_PARAMS)
+    yield conn
+    conn.close()
+
+
+@pytest.mark.skipif(not _HAS_DB, reason="Database not available for performance testing")
 class TestDatabasePerformance:
     """Test database query performance"""
 
-    @pytest.fixture
-    def db_connection(self):
-        """Database connection for testing"""
-        try:
-            conn = psycopg2.connect(
-                host=os.getenv('DB_HOST', 'localhost'),
-                port=os.getenv('DB_PORT', 5432),
-                database=os.getenv('DB_NAME', 'swissnews_test'),
-                user=os.getenv('DB_USER', 'postgres'),
-                password=os.getenv('DB_PASSWORD', 'postgres')
-            )
-            yield conn
-            conn.close()
-        except psycopg2.Error:
-            pytest.skip("Database not available for performance testing")
-
     def test_article_query_performance(self, db_connection):
         """Test that article queries complete within acceptable time"""
         cursor = db_connection.cursor()
 
         # Test basic article selection
-        start_time = time.time()
-        cursor.execute("SELECT * FROM articles LIMIT 100")
+        start_ns = time.perf_counter_ns()
+        cursor.execute("SELECT id, title, publish_date FROM articles LIMIT 100")
         results = cursor.fetchall()
-        end_time = time.time()
+        end_ns = time.perf_counter_ns()
 
-        query_time = end_time - start_time
+        query_time_ns = end_ns - start_ns
 
         # Should complete within 100ms for 100 articles
-        assert query_time < 0.1, f"Article query took {query_time:.3f}s, expected < 0.1s"
+        assert query_time_ns < 100_000_000, f"Article query took {query_time_ns / NS_PER_S:.3f}s, expected < 0.1s"
 
         cursor.close()
 
@@ -60,15 +79,15 @@ class TestDatabasePerformance:
         """Test that outlet queries are fast"""
         cursor = db_connection.cursor()
 
-        start_time = time.time()
-        cursor.execute("SELECT * FROM outlets")
+        start_ns = time.perf_counter_ns()
+        cursor.execute("SELECT id, name, language FROM outlets")
         results = cursor.fetchall()
-        end_time = time.time()
+        end_ns = time.perf_counter_ns()
 
-        query_time = end_time - start_time
+        query_time_ns = end_ns - start_ns
 
         # Should complete very quickly as outlets table is small
-        assert query_time < 0.05, f"Outlet query took {query_time:.3f}s, expected < 0.05s"
+        assert query_time_ns < 50_000_000, f"Outlet query took {query_time_ns / NS_PER_S:.3f}s, expected < 0.05s"
 
         cursor.close()
 
@@ -76,7 +95,7 @@ class TestDatabasePerformance:
         """Test performance of articles joined with outlets"""
         cursor = db_connection.cursor()
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         cursor.execute("""
             SELECT a.id, a.title, a.publish_date, o.name as outlet_name, o.language
             FROM articles a
@@ -85,107 +104,113 @@ class TestDatabasePerformance:
             LIMIT 50
         """)
         results = cursor.fetchall()
-        end_time = time.time()
+        end_ns = time.perf_counter_ns()
 
-        query_time = end_time - start_time
+        query_time_ns = end_ns - start_ns
 
         # Should complete within 200ms for joined query
-        assert query_time < 0.2, f"Article-outlet join took {query_time:.3f}s, expected < 0.2s"
+        assert query_time_ns < 200_000_000, f"Article-outlet join took {query_time_ns / NS_PER_S:.3f}s, expected < 0.2s"
 
         cursor.close()
 
+    @pytest.fixture
+    def connection_pool(self):
+        """Threaded connection pool, closed after the test"""
+        pool = ThreadedConnectionPool(1, 10, **DB_PARAMS)
+        yield pool
+        pool.closeall()
+
     @pytest.mark.slow
-    def test_database_connection_pool_performance(self):
+    def test_database_connection_pool_performance(self, connection_pool):
         """Test database connection pool performance"""
-        connection_times = []
+        checkout_times = []
 
         for i in range(10):
-            start_time = time.time()
-            try:
-                conn = psycopg2.connect(
-                    host=os.getenv('DB_HOST', 'localhost'),
-                    port=os.getenv('DB_PORT', 5432),
-                    database=os.getenv('DB_NAME', 'swissnews_test'),
-                    user=os.getenv('DB_USER', 'postgres'),
-                    password=os.getenv('DB_PASSWORD', 'postgres')
-                )
-                conn.close()
-                end_time = time.time()
-                connection_times.append(end_time - start_time)
-            except psycopg2.Error:
-                pytest.skip("Database not available for performance testing")
-
-        avg_connection_time = statistics.mean(connection_times)
-        max_connection_time = max(connection_times)
-
-        # Average connection time should be reasonable
-        assert avg_connection_time < 0.1, f"Average connection time {avg_connection_time:.3f}s too slow"
-        assert max_connection_time < 0.2, f"Max connection time {max_connection_time:.3f}s too slow"
+            start_ns = time.perf_counter_ns()
+            conn = connection_pool.getconn()
+            connection_pool.putconn(conn)
+            end_ns = time.perf_counter_ns()
+            checkout_times.append(end_ns - start_ns)
+
+        avg_checkout_time_ns = statistics.mean(checkout_times)
+        max_checkout_time_ns = max(checkout_times)
+
+        # Pooled connections are reused, so a checkout should take well under 1ms
+        assert avg_checkout_time_ns < 1_000_000, f"Average pool checkout time {avg_checkout_time_ns / NS_PER_S:.6f}s too slow"
+        assert max_checkout_time_ns < 5_000_000, f"Max pool checkout time {max_checkout_time_ns / NS_PER_S:.6f}s too slow"
+
+
+@pytest.fixture(scope="class")
+def http_client():
+    """HTTP client whose connection pool is shared by the whole class"""
+    import httpx
+
+    with httpx.Client(base_url="http://localhost:8000", timeout=5.0) as client:
+        yield client
 
 
 class TestAPIPerformance:
     """Test API endpoint performance"""
 
-    def measure_request_time(self, url: str, method: str = "GET", data=None) -> float:
-        """Measure time to complete HTTP request"""
+    def measure_request_time(self, http_client, url: str, method: str = "GET", data=None) -> int:
+        """Measure time to complete HTTP request, in nanoseconds"""
         import httpx
 
-        client = httpx.Client(base_url="http://localhost:8000")
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             if method == "GET":
-                response = client.get(url, timeout=5.0)
+                response = http_client.get(url)
             elif method == "POST":
-                response = client.post(url, json=data, timeout=5.0)
-            end_time = time.time()
+                response = http_client.post(url, json=data)
+            end_ns = time.perf_counter_ns()
 
-            return end_time - start_time
+            return end_ns - start_ns
         except httpx.ConnectError:
             pytest.skip("API server not available for performance testing")
         except httpx.TimeoutException:
-            return 5.0  # Timeout occurred
-        finally:
-            client.close()
+            return 5 * NS_PER_S  # Timeout occurred
 
-    def test_articles_endpoint_performance(self):
+    def test_articles_endpoint_performance(self, http_client):
         """Test articles endpoint response time"""
-        response_time = self.measure_request_time("/api/articles")
+        response_time_ns = self.measure_request_time(http_client, "/api/articles")
 
         # Should respond within 500ms
-        assert response_time < 0.5, f"Articles endpoint took {response_time:.3f}s, expected < 0.5s"
+        assert response_time_ns < 500_000_000, f"Articles endpoint took {response_time_ns / NS_PER_S:.3f}s, expected < 0.5s"
 
-    def test_outlets_endpoint_performance(self):
+    def test_outlets_endpoint_performance(self, http_client):
         """Test outlets endpoint response time"""
-        response_time = self.measure_request_time("/api/outlets")
+        response_time_ns = self.measure_request_time(http_client, "/api/outlets")
 
         # Should respond very quickly
-        assert response_time < 0.2, f"Outlets endpoint took {response_time:.3f}s, expected < 0.2s"
+        assert response_time_ns < 200_000_000, f"Outlets endpoint took {response_time_ns / NS_PER_S:.3f}s, expected < 0.2s"
 
     @pytest.mark.slow
     def test_api_concurrent_requests_performance(self):
         """Test API performance under concurrent load"""
-        import concurrent.futures
         import httpx
 
-        def make_request():
-            client = httpx.Client(base_url="http://localhost:8000")
+        async def make_request(client):
             try:
-                start_time = time.time()
-                response = client.get("/api/articles", timeout=10.0)
-                end_time = time.time()
-                return end_time - start_time
+                start_ns = time.perf_counter_ns()
+                response = await client.get("/api/articles")
+                end_ns = time.perf_counter_ns()
+                return end_ns - start_ns
             except httpx.ConnectError:
                 return None  # Skip if server not available
             except httpx.TimeoutException:
-                return 10.0  # Timeout
-            finally:
-                client.close()
+                return 10 * NS_PER_S  # Timeout
+
+        # All requests share one event loop and one keep-alive pool
+        async def make_requests(count):
+            async with httpx.AsyncClient(
+                base_url="http://localhost:8000",
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=count),
+            ) as client:
+                return await asyncio.gather(*(make_request(client) for _ in range(count)))
 
         # Test with 10 concurrent requests
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(make_request) for _ in range(10)]
-            response_times = [f.result() for f in concurrent.futures.as_completed(futures)]
+        response_times = asyncio.run(make_requests(10))
 
         # Filter out None values (server not available)
         response_times = [t for t in response_times if t is not None]
@@ -193,12 +218,12 @@ class TestAPIPerformance:
         if len(response_times) == 0:
             pytest.skip("API server not available for concurrent testing")
 
-        avg_response_time = statistics.mean(response_times)
-        max_response_time = max(response_times)
+        avg_response_time_ns = statistics.mean(response_times)
+        max_response_time_ns = max(response_times)
 
         # Under concurrent load, should still be reasonable
-        assert avg_response_time < 1.0, f"Average concurrent response time {avg_response_time:.3f}s too slow"
-        assert max_response_time < 2.0, f"Max concurrent response time {max_response_time:.3f}s too slow"
+        assert avg_response_time_ns < 1_000_000_000, f"Average concurrent response time {avg_response_time_ns / NS_PER_S:.3f}s too slow"
+        assert max_response_time_ns < 2_000_000_000, f"Max concurrent response time {max_response_time_ns / NS_PER_S:.3f}s too slow"
 
 
 class TestScrapingPerformance:
@@ -213,7 +238,7 @@ class TestScrapingPerformance:
 
         scraper = SwissNewsWikipediaScraper()
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Mock the actual HTTP request to avoid network dependency
         with patch.object(scraper, 'fetch_page') as mock_fetch:
@@ -229,16 +254,16 @@ class TestScrapingPerformance:
             """
 
             from bs4 import BeautifulSoup
-            mock_fetch.return_value = BeautifulSoup(mock_html, 'html.parser')
+            mock_fetch.return_value = BeautifulSoup(mock_html, 'lxml')
 
             # Test scraping performance
             outlets = scraper.scrape_all_languages()
 
-            end_time = time.time()
-            scraping_time = end_time - start_time
+            end_ns = time.perf_counter_ns()
+            scraping_time_ns = end_ns - start_ns
 
             # Should complete scraping quickly with mocked data
-            assert scraping_time < 1.0, f"Scraping took {scraping_time:.3f}s, expected < 1.0s"
+            assert scraping_time_ns < 1_000_000_000, f"Scraping took {scraping_time_ns / NS_PER_S:.3f}s, expected < 1.0s"
             assert len(outlets) > 0, "Should have scraped some outlets"
 
     @pytest.mark.external
@@ -251,7 +276,7 @@ class TestScrapingPerformance:
 
         scraper = SwissNewsWikipediaScraper()
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Test just one section to avoid long test times
@@ -261,11 +286,11 @@ class TestScrapingPerformance:
             if len(tables) > 0:
                 outlets = scraper.parse_table(tables[0], 'German')
 
-                end_time = time.time()
-                scraping_time = end_time - start_time
+                end_ns = time.perf_counter_ns()
+                scraping_time_ns = end_ns - start_ns
 
                 # Should complete within reasonable time
-                assert scraping_time < 10.0, f"Real scraping took {scraping_time:.3f}s, expected < 10.0s"
+                assert scraping_time_ns < 10_000_000_000, f"Real scraping took {scraping_time_ns / NS_PER_S:.3f}s, expected < 10.0s"
 
         except Exception as e:
             pytest.skip(f"Network scraping failed: {e}")
@@ -276,25 +301,24 @@ class TestMemoryPerformance:
 
     def test_memory_usage_during_processing(self):
         """Test that memory usage stays reasonable during processing"""
-        import psutil
-        import os
+        psutil = pytest.importorskip('psutil')
 
         process = psutil.Process(os.getpid())
         initial_memory = process.memory_info().rss / 1024 / 1024  # MB
 
-        # Simulate processing large dataset
-        large_data = []
-        for i in range(10000):
-            large_data.append({
-                'id': i,
-                'title': f'Article {i}' * 10,  # Make it somewhat large
-                'content': f'Content for article {i}' * 50
-            })
+        # Simulate processing large dataset, stored column-wise: one packed
+        # id array and one list per text field instead of a dict per row
+        ids = array('q', range(10000))
+        large_data = {
+            'id': ids,
+            'title': [f'Article {i}' * 10 for i in ids],  # Make it somewhat large
+            'content': [f'Content for article {i}' * 50 for i in ids],
+        }
 
         peak_memory = process.memory_info().rss / 1024 / 1024  # MB
 
         # Clean up
-        del large_data
+        del large_data, ids
 
         final_memory = process.memory_info().rss / 1024 / 1024  # MB
 
@@ -302,7 +326,8 @@ class TestMemoryPerformance:
         memory_leak = final_memory - initial_memory
 
         # Should not use excessive memory
-        assert memory_increase < 500, f"Memory usage increased by {memory_increase:.1f}MB, expected < 500MB"
+        # (the ~12MB of text itself plus headroom)
+        assert memory_increase < 25, f"Memory usage increased by {memory_increase:.1f}MB, expected < 25MB"
 
         # Should not have significant memory leak
         assert memory_leak < 50, f"Potential memory leak of {memory_leak:.1f}MB"
@@ -314,7 +339,6 @@ class TestFrontendPerformance:
     def test_bundle_size_expectations(self):
         """Test that built frontend bundle sizes are reasonable"""
         import os
-        import glob
 
         # Look for built frontend files
         frontend_build_dir = os.path.join(os.path.dirname(__file__), '../../frontend/.next')
@@ -323,16 +347,24 @@ class TestFrontendPerformance:
             pytest.skip("Frontend not built, run 'npm run build' first")
 
         # Check JavaScript bundle sizes
-        js_files = glob.glob(os.path.join(frontend_build_dir, 'static/chunks/*.js'))
+        chunks_dir = os.path.join(frontend_build_dir, 'static/chunks')
 
         total_js_size = 0
-        for js_file in js_files:
-            size = os.path.getsize(js_file)
-            total_js_size += size
-
-            # Individual chunks should not be too large
-            size_mb = size / 1024 / 1024
-            assert size_mb < 5.0, f"JS chunk {os.path.basename(js_file)} is {size_mb:.1f}MB, expected < 5MB"
+        if os.path.isdir(chunks_dir):
+            # scandir entries carry their stat data, so no per-file getsize()
+            with os.scandir(chunks_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.name.endswith('.js'):
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    size = entry.stat().st_size
+                    total_js_size += size
+
+                    # Individual chunks should not be too large
+                    size_mb = size / 1024 / 1024
+                    assert size_mb < 5.0, f"JS chunk {entry.name} is {size_mb:.1f}MB, expected < 5MB"
 
         # Total JS size should be reasonable
         total_js_mb = total_js_size / 1024 / 1024
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the unit tests.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Make the backend packages importable; runs once, before any test module
+BACKEND_DIR = str((Path(__file__).parent / "../../backend").resolve())
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make time.sleep a no-op so retry backoff never blocks a test"""
+    monkeypatch.setattr(time, "sleep", lambda *_: None)
@@ -8,15 +8,68 @@ configuration handling, error handling, and retry logic.
 Issue: https://github.com/devpouya/swissnews/issues/3
 """
 
+import types
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
 
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
 
-from scraper.base import BaseScraper, OutletScraper, ScrapingError
+from scraper.base import CHROME_ARGUMENTS, BaseScraper, OutletScraper, ScrapingError
+
+
+@pytest.fixture(scope="module")
+def chrome_patch():
+    """Patch the Chrome WebDriver class once for the whole module."""
+    with patch('scraper.base.webdriver.Chrome') as mock_chrome:
+        yield mock_chrome
+
+
+@pytest.fixture
+def mock_chrome(chrome_patch):
+    """Module-wide Chrome patch, reset to a fresh driver for each test."""
+    chrome_patch.reset_mock(return_value=True, side_effect=True)
+    chrome_patch.return_value = Mock()
+    return chrome_patch
+
+
+@pytest.fixture(scope="module")
+def wait_patch():
+    """Patch WebDriverWait once for the whole module."""
+    with patch('scraper.base.WebDriverWait') as mock_wait:
+        yield mock_wait
+
+
+@pytest.fixture
+def mock_wait(wait_patch):
+    """Module-wide WebDriverWait patch, reset for each test."""
+    wait_patch.reset_mock(return_value=True, side_effect=True)
+    wait_patch.return_value = Mock()
+    return wait_patch
+
+
+def fake_el(text="", href=""):
+    """Cheap stand-in for a WebElement that is only read, never asserted on."""
+    return types.SimpleNamespace(text=text, get_attribute=lambda name: href)
+
+
+def call_sequence(outcomes):
+    """Plain function returning (or raising) each outcome in turn, with a call log."""
+    remaining = iter(outcomes)
+    calls = []
+
+    def func(*args, **kwargs):
+        calls.append((args, kwargs))
+        outcome = next(remaining)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return func, calls
 
 
 class _TestableBaseScraper(BaseScraper):
@@ -85,7 +138,6 @@ class TestBaseScraper:
         assert scraper.max_retry_attempts == 3  # Default
         assert scraper.retry_delay == 2  # Default
 
-    @patch('scraper.base.webdriver.Chrome')
     def test_setup_driver_success(self, mock_chrome, sample_config):
         """Test successful WebDriver setup."""
         mock_driver = Mock()
@@ -99,7 +151,22 @@ class TestBaseScraper:
         mock_driver.set_page_load_timeout.assert_called_once_with(30)
         mock_chrome.assert_called_once()
 
-    @patch('scraper.base.webdriver.Chrome')
+    def test_chrome_options_fresh_per_driver(self, mock_chrome, sample_config):
+        """Test that every driver gets its own Chrome options with the same arguments."""
+        for _ in range(2):
+            _TestableBaseScraper(sample_config).setup_driver()
+        other_config = dict(sample_config, user_agent="Other User Agent")
+        _TestableBaseScraper(other_config).setup_driver()
+
+        first, second, other = (
+            call.kwargs["options"] for call in mock_chrome.call_args_list
+        )
+        assert first is not second
+        assert first.arguments == second.arguments
+        assert first.arguments[:-1] == list(CHROME_ARGUMENTS)
+        assert first.arguments[-1] == "--user-agent=Test User Agent"
+        assert other.arguments[-1] == "--user-agent=Other User Agent"
+
     def test_setup_driver_failure(self, mock_chrome, sample_config):
         """Test WebDriver setup failure."""
         mock_chrome.side_effect = Exception("WebDriver setup failed")
@@ -109,41 +176,27 @@ class TestBaseScraper:
         with pytest.raises(ScrapingError, match="WebDriver setup failed"):
             scraper.setup_driver()
 
-    def test_retry_on_failure_success_on_first_attempt(self, sample_config):
-        """Test retry decorator with successful first attempt."""
+    @pytest.mark.parametrize("outcomes, expected_calls, expected", [
+        (["success"], 1, "success"),
+        ([TimeoutException(), TimeoutException(), "success"], 3, "success"),
+        ([TimeoutException("Timeout")] * 3, 3, ScrapingError),
+    ], ids=["first_attempt", "after_retries", "all_attempts_fail"])
+    def test_retry_on_failure(self, sample_config, outcomes, expected_calls, expected):
+        """Test retry logic across success, recovery and exhaustion."""
         scraper = _TestableBaseScraper(sample_config)
 
-        mock_func = Mock(return_value="success")
-        result = scraper.retry_on_failure(mock_func, "arg1", kwarg1="value1")
-
-        assert result == "success"
-        mock_func.assert_called_once_with("arg1", kwarg1="value1")
-
-    def test_retry_on_failure_success_after_retries(self, sample_config):
-        """Test retry decorator with success after retries."""
-        scraper = _TestableBaseScraper(sample_config)
-
-        mock_func = Mock(side_effect=[TimeoutException(), TimeoutException(), "success"])
-
-        with patch('time.sleep'):  # Mock sleep to speed up test
-            result = scraper.retry_on_failure(mock_func)
+        func, calls = call_sequence(outcomes)
 
-        assert result == "success"
-        assert mock_func.call_count == 3
-
-    def test_retry_on_failure_all_attempts_fail(self, sample_config):
-        """Test retry decorator when all attempts fail."""
-        scraper = _TestableBaseScraper(sample_config)
-
-        mock_func = Mock(side_effect=TimeoutException("Timeout"))
-
-        with patch('time.sleep'):  # Mock sleep to speed up test
+        if expected is ScrapingError:
             with pytest.raises(ScrapingError, match="Operation failed after 3 attempts"):
-                scraper.retry_on_failure(mock_func)
+                scraper.retry_on_failure(func, "arg1", kwarg1="value1")
+        else:
+            result = scraper.retry_on_failure(func, "arg1", kwarg1="value1")
+            assert result == expected
 
-        assert mock_func.call_count == 3
+        assert len(calls) == expected_calls
+        assert calls[-1] == (("arg1",), {"kwarg1": "value1"})
 
-    @patch('scraper.base.WebDriverWait')
     def test_safe_find_element_success(self, mock_wait, sample_config):
         """Test successful element finding."""
         mock_driver = Mock()
@@ -161,7 +214,6 @@ class TestBaseScraper:
 
         assert result == mock_element
 
-    @patch('scraper.base.WebDriverWait')
     def test_safe_find_element_timeout(self, mock_wait, sample_config):
         """Test element finding with timeout."""
         mock_driver = Mock()
@@ -205,21 +257,15 @@ class TestBaseScraper:
 
         assert result == []
 
-    @patch('scraper.base.webdriver.Chrome')
-    def test_get_page_success(self, mock_chrome, sample_config):
+    def test_get_page_success(self, mock_chrome, mock_wait, sample_config):
         """Test successful page navigation."""
-        mock_driver = Mock()
+        mock_driver = mock_chrome.return_value
         mock_driver.execute_script.return_value = "complete"
-        mock_chrome.return_value = mock_driver
 
         scraper = _TestableBaseScraper(sample_config)
         scraper.setup_driver()
 
-        with patch('scraper.base.WebDriverWait') as mock_wait:
-            mock_wait_instance = Mock()
-            mock_wait.return_value = mock_wait_instance
-
-            result = scraper.get_page("https://test.com")
+        result = scraper.get_page("https://test.com")
 
         assert result is True
         mock_driver.get.assert_called_once_with("https://test.com")
@@ -301,18 +347,18 @@ class TestOutletScraper:
             }
         }
 
-    @patch('scraper.base.OutletScraper.get_page')
-    @patch('scraper.base.OutletScraper.safe_find_elements')
-    def test_scrape_article_list_success(self, mock_find_elements, mock_get_page, sample_config):
+    @patch.multiple('scraper.base.OutletScraper',
+                    get_page=DEFAULT, safe_find_elements=DEFAULT)
+    def test_scrape_article_list_success(self, sample_config, **mocks):
         """Test successful article list scraping."""
+        mock_get_page = mocks['get_page']
+        mock_find_elements = mocks['safe_find_elements']
         # Mock successful page load
         mock_get_page.return_value = True
 
         # Mock article link elements
-        mock_element1 = Mock()
-        mock_element1.get_attribute.return_value = "/article/test-1"
-        mock_element2 = Mock()
-        mock_element2.get_attribute.return_value = "https://test-outlet.ch/article/test-2"
+        mock_element1 = fake_el(href="/article/test-1")
+        mock_element2 = fake_el(href="https://test-outlet.ch/article/test-2")
 
         mock_find_elements.return_value = [mock_element1, mock_element2]
 
@@ -327,10 +373,9 @@ class TestOutletScraper:
         assert urls == expected_urls
         mock_get_page.assert_called_once_with("https://test-outlet.ch")
 
-    @patch('scraper.base.OutletScraper.get_page')
-    def test_scrape_article_list_page_load_failure(self, mock_get_page, sample_config):
+    def test_scrape_article_list_page_load_failure(self, monkeypatch, sample_config):
         """Test article list scraping with page load failure."""
-        mock_get_page.return_value = False
+        monkeypatch.setattr(OutletScraper, "get_page", lambda self, url: False)
 
         scraper = OutletScraper(sample_config)
         urls = scraper.scrape_article_list()
@@ -347,32 +392,28 @@ class TestOutletScraper:
 
         assert urls == []
 
-    @patch('scraper.base.OutletScraper.get_page')
-    @patch('scraper.base.OutletScraper.safe_find_element')
-    @patch('scraper.base.OutletScraper.safe_find_elements')
-    def test_scrape_article_content_success(self, mock_find_elements, mock_find_element,
-                                          mock_get_page, sample_config):
+    @patch.multiple('scraper.base.OutletScraper', get_page=DEFAULT,
+                    safe_find_element=DEFAULT, safe_find_elements=DEFAULT)
+    def test_scrape_article_content_success(self, sample_config, **mocks):
         """Test successful article content scraping."""
+        mock_get_page = mocks['get_page']
+        mock_find_element = mocks['safe_find_element']
+        mock_find_elements = mocks['safe_find_elements']
         # Mock successful page load
         mock_get_page.return_value = True
 
         # Mock title element
-        mock_title = Mock()
-        mock_title.text = "Test Article Title"
+        mock_title = fake_el(text="Test Article Title")
 
         # Mock content elements
-        mock_content1 = Mock()
-        mock_content1.text = "First paragraph"
-        mock_content2 = Mock()
-        mock_content2.text = "Second paragraph"
+        mock_content1 = fake_el(text="First paragraph")
+        mock_content2 = fake_el(text="Second paragraph")
 
         # Mock author element
-        mock_author = Mock()
-        mock_author.text = "Test Author"
+        mock_author = fake_el(text="Test Author")
 
         # Mock date element
-        mock_date = Mock()
-        mock_date.text = "2024-01-01"
+        mock_date = fake_el(text="2024-01-01")
 
         # Configure mock returns based on selector
         def mock_find_element_side_effect(by, selector):
@@ -403,10 +444,9 @@ class TestOutletScraper:
         assert article_data["outlet"] == "test_outlet"
         assert "scraped_at" in article_data
 
-    @patch('scraper.base.OutletScraper.get_page')
-    def test_scrape_article_content_page_load_failure(self, mock_get_page, sample_config):
+    def test_scrape_article_content_page_load_failure(self, monkeypatch, sample_config):
         """Test article content scraping with page load failure."""
-        mock_get_page.return_value = False
+        monkeypatch.setattr(OutletScraper, "get_page", lambda self, url: False)
 
         scraper = OutletScraper(sample_config)
         article_data = scraper.scrape_article_content("https://test-outlet.ch/article/test")
@@ -416,10 +456,12 @@ class TestOutletScraper:
         assert article_data["content"] == ""
         assert article_data["outlet"] == "test_outlet"
 
-    @patch('scraper.base.OutletScraper.get_page')
-    def test_scrape_article_content_exception(self, mock_get_page, sample_config):
+    def test_scrape_article_content_exception(self, monkeypatch, sample_config):
         """Test article content scraping with exception."""
-        mock_get_page.side_effect = Exception("Scraping error")
+        def failing_get_page(self, url):
+            raise Exception("Scraping error")
+
+        monkeypatch.setattr(OutletScraper, "get_page", failing_get_page)
 
         scraper = OutletScraper(sample_config)
         article_data = scraper.scrape_article_content("https://test-outlet.ch/article/test")
@@ -429,6 +471,50 @@ class TestOutletScraper:
         assert article_data["content"] == ""
         assert article_data["outlet"] == "test_outlet"
 
+    @patch('scraper.base.OutletScraper.get_page')
+    @patch('scraper.base.OutletScraper.safe_find_element')
+    @patch('scraper.base.OutletScraper.safe_find_elements')
+    def test_selectors_precached(self, mock_find_elements, mock_find_element,
+                                 mock_get_page, sample_config):
+        """Test that selectors are resolved once at initialization."""
+        mock_get_page.return_value = True
+        mock_find_element.return_value = None
+        mock_find_elements.return_value = []
+
+        scraper = OutletScraper(sample_config)
+
+        assert scraper._sel_links == "a.article-link"
+        assert scraper._sel_title == "h1.title"
+        assert scraper._sel_content == ".content p"
+        assert scraper._sel_author == ".author"
+        assert scraper._sel_date == ".date"
+
+        # The hot path must not go back to the selector configuration
+        scraper.selectors = MagicMock()
+        scraper.scrape_article_list()
+        scraper.scrape_article_content("https://test-outlet.ch/article/test")
+
+        scraper.selectors.get.assert_not_called()
+        scraper.selectors.__getitem__.assert_not_called()
+        mock_find_element.assert_any_call(By.CSS_SELECTOR, "h1.title")
+
+    def test_driver_reused_across_articles(self, mock_chrome, mock_wait, sample_config):
+        """Test that one WebDriver serves every article in a batch."""
+        mock_driver = mock_chrome.return_value
+        mock_driver.find_elements.return_value = []
+
+        scraper = OutletScraper(sample_config)
+        scraper.setup_driver()
+        for i in range(5):
+            scraper.scrape_article_content(f"https://test-outlet.ch/article/{i}")
+
+        assert mock_chrome.call_count == 1
+        assert mock_driver.get.call_count == 5
+        mock_driver.quit.assert_not_called()
+
+        # Consent and paywall cookies survive between pages on the shared driver
+        mock_driver.delete_all_cookies.assert_not_called()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
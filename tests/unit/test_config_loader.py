@@ -7,25 +7,26 @@ Tests configuration loading, validation, and management for the scraper framewor
 Issue: https://github.com/devpouya/swissnews/issues/3
 """
 
+import re
+
 import pytest
-import tempfile
-import os
 from pathlib import Path
-from unittest.mock import patch, mock_open
-
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
+from unittest.mock import patch, sentinel
 
 from scraper.config_loader import ConfigLoader, ConfigurationError
 
 
-class TestConfigLoader:
-    """Test cases for the ConfigLoader class."""
+# Expected ConfigurationError messages, compiled once for pytest.raises(match=...)
+_ERR_NOT_FOUND = re.compile("Configuration file not found")
+_ERR_PARSE = re.compile("Failed to parse YAML")
+_ERR_EMPTY = re.compile("Configuration file is empty")
+_ERR_OUTLET_MISSING = re.compile("Outlet 'non_existent' not found")
+_ERR_MISSING_FIELD = re.compile("missing required field")
+_ERR_LANG = re.compile("unsupported language")
+_ERR_RANGE = re.compile("outside valid range")
 
-    @pytest.fixture
-    def sample_yaml_config(self):
-        """Sample YAML configuration for testing."""
-        return """
+# One fully specified outlet and one relying on the defaults
+_SAMPLE_YAML = """
 outlets:
   test_outlet:
     name: "Test Outlet"
@@ -90,10 +91,8 @@ validation:
       max: 10
 """
 
-    @pytest.fixture
-    def invalid_yaml_config(self):
-        """Invalid YAML configuration for testing error handling."""
-        return """
+# Outlet missing every required field except its name
+_INVALID_YAML = """
 outlets:
   invalid_outlet:
     name: "Invalid Outlet"
@@ -107,186 +106,8 @@ validation:
     - selectors
 """
 
-    def test_initialization_with_custom_path(self):
-        """Test ConfigLoader initialization with custom path."""
-        custom_path = "/custom/path/config.yaml"
-        loader = ConfigLoader(custom_path)
-
-        assert str(loader.config_path) == custom_path
-
-    def test_initialization_with_default_path(self):
-        """Test ConfigLoader initialization with default path."""
-        loader = ConfigLoader()
-
-        expected_path = Path(__file__).parent.parent.parent / "backend" / "scraper" / "config" / "outlets.yaml"
-        # Just check the filename since absolute paths may vary
-        assert loader.config_path.name == "outlets.yaml"
-
-    def test_load_config_success(self, sample_yaml_config):
-        """Test successful configuration loading."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(sample_yaml_config)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-            config_data = loader.load_config()
-
-            assert "outlets" in config_data
-            assert "defaults" in config_data
-            assert "validation" in config_data
-            assert len(loader.outlets) == 2
-            assert "test_outlet" in loader.outlets
-            assert "minimal_outlet" in loader.outlets
-        finally:
-            os.unlink(temp_path)
-
-    def test_load_config_file_not_found(self):
-        """Test configuration loading with non-existent file."""
-        loader = ConfigLoader("/non/existent/path.yaml")
-
-        with pytest.raises(ConfigurationError, match="Configuration file not found"):
-            loader.load_config()
-
-    def test_load_config_invalid_yaml(self):
-        """Test configuration loading with invalid YAML."""
-        invalid_yaml = "invalid: yaml: content: ["
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Failed to parse YAML"):
-                loader.load_config()
-        finally:
-            os.unlink(temp_path)
-
-    def test_load_config_empty_file(self):
-        """Test configuration loading with empty file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("")
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-            with pytest.raises(ConfigurationError, match="Configuration file is empty"):
-                loader.load_config()
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_outlet_config_success(self, sample_yaml_config):
-        """Test successful outlet configuration retrieval."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(sample_yaml_config)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-            config = loader.get_outlet_config("test_outlet")
-
-            assert config["name"] == "Test Outlet"
-            assert config["url"] == "https://test.ch"
-            assert config["language"] == "de"
-            assert config["timeouts"]["page_load"] == 25
-            assert config["timeouts"]["element_wait"] == 8
-            assert config["retry"]["max_attempts"] == 2
-            assert config["retry"]["delay"] == 1.5
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_outlet_config_with_defaults_merged(self, sample_yaml_config):
-        """Test outlet configuration retrieval with defaults merged."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(sample_yaml_config)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-            config = loader.get_outlet_config("minimal_outlet")
-
-            # Should have outlet-specific values
-            assert config["name"] == "Minimal Outlet"
-            assert config["url"] == "https://minimal.ch"
-            assert config["language"] == "fr"
-
-            # Should have defaults merged
-            assert config["timeouts"]["page_load"] == 30  # From defaults
-            assert config["timeouts"]["element_wait"] == 10  # From defaults
-            assert config["retry"]["max_attempts"] == 3  # From defaults
-            assert config["retry"]["delay"] == 2  # From defaults
-            assert config["user_agent"] == "Test Agent"  # From defaults
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_outlet_config_not_found(self, sample_yaml_config):
-        """Test outlet configuration retrieval for non-existent outlet."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(sample_yaml_config)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-
-            with pytest.raises(ConfigurationError, match="Outlet 'non_existent' not found"):
-                loader.get_outlet_config("non_existent")
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_all_outlets(self, sample_yaml_config):
-        """Test getting all outlet names."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(sample_yaml_config)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-            outlets = loader.get_all_outlets()
-
-            assert len(outlets) == 2
-            assert "test_outlet" in outlets
-            assert "minimal_outlet" in outlets
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_outlets_by_language(self, sample_yaml_config):
-        """Test getting outlets filtered by language."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(sample_yaml_config)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-
-            german_outlets = loader.get_outlets_by_language("de")
-            assert german_outlets == ["test_outlet"]
-
-            french_outlets = loader.get_outlets_by_language("fr")
-            assert french_outlets == ["minimal_outlet"]
-
-            italian_outlets = loader.get_outlets_by_language("it")
-            assert italian_outlets == []
-        finally:
-            os.unlink(temp_path)
-
-    def test_validate_outlet_config_missing_required_field(self, invalid_yaml_config):
-        """Test configuration validation with missing required fields."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml_config)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-
-            with pytest.raises(ConfigurationError, match="missing required field"):
-                loader.get_outlet_config("invalid_outlet")
-        finally:
-            os.unlink(temp_path)
-
-    def test_validate_outlet_config_unsupported_language(self):
-        """Test configuration validation with unsupported language."""
-        config_with_invalid_language = """
+# Outlet configs that each break one validation rule
+_INVALID_LANGUAGE_YAML = """
 outlets:
   invalid_lang_outlet:
     name: "Invalid Language Outlet"
@@ -309,21 +130,7 @@ validation:
     - it
 """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(config_with_invalid_language)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-
-            with pytest.raises(ConfigurationError, match="unsupported language"):
-                loader.get_outlet_config("invalid_lang_outlet")
-        finally:
-            os.unlink(temp_path)
-
-    def test_validate_timeout_limits(self):
-        """Test timeout validation against limits."""
-        config_with_invalid_timeout = """
+_INVALID_TIMEOUT_YAML = """
 outlets:
   invalid_timeout_outlet:
     name: "Invalid Timeout Outlet"
@@ -348,21 +155,7 @@ validation:
       max: 60
 """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(config_with_invalid_timeout)
-            temp_path = f.name
-
-        try:
-            loader = ConfigLoader(temp_path)
-
-            with pytest.raises(ConfigurationError, match="outside valid range"):
-                loader.get_outlet_config("invalid_timeout_outlet")
-        finally:
-            os.unlink(temp_path)
-
-    def test_validate_retry_limits(self):
-        """Test retry validation against limits."""
-        config_with_invalid_retry = """
+_INVALID_RETRY_YAML = """
 outlets:
   invalid_retry_outlet:
     name: "Invalid Retry Outlet"
@@ -387,110 +180,226 @@ validation:
       max: 10
 """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(config_with_invalid_retry)
-            temp_path = f.name
 
-        try:
-            loader = ConfigLoader(temp_path)
+@pytest.fixture(scope="session")
+def sample_yaml_config():
+    """Sample YAML configuration for testing."""
+    return _SAMPLE_YAML
 
-            with pytest.raises(ConfigurationError, match="outside valid range"):
-                loader.get_outlet_config("invalid_retry_outlet")
-        finally:
-            os.unlink(temp_path)
 
-    def test_validate_all_outlets_success(self, sample_yaml_config):
-        """Test validation of all outlets with success."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(sample_yaml_config)
-            temp_path = f.name
+@pytest.fixture(scope="session")
+def invalid_yaml_config():
+    """Invalid YAML configuration for testing error handling."""
+    return _INVALID_YAML
 
-        try:
-            loader = ConfigLoader(temp_path)
-            results = loader.validate_all_outlets()
 
-            assert len(results) == 2
-            assert results["test_outlet"] is True
-            assert results["minimal_outlet"] is True
-        finally:
-            os.unlink(temp_path)
+@pytest.fixture(scope="session")
+def sample_config_path(sample_yaml_config, tmp_path_factory):
+    """Sample configuration written to disk once for the read-only tests."""
+    path = tmp_path_factory.mktemp("cfg") / "outlets.yaml"
+    path.write_text(sample_yaml_config)
+    return str(path)
 
-    def test_validate_all_outlets_with_failures(self, invalid_yaml_config):
-        """Test validation of all outlets with some failures."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml_config)
-            temp_path = f.name
 
-        try:
-            loader = ConfigLoader(temp_path)
-            results = loader.validate_all_outlets()
+@pytest.fixture(scope="session")
+def shared_loader(sample_config_path):
+    """Loader parsed once and shared by the tests that only read from it."""
+    loader = ConfigLoader(sample_config_path)
+    loader.load_config()
+    return loader
 
-            assert len(results) == 1
-            assert results["invalid_outlet"] is False
-        finally:
-            os.unlink(temp_path)
 
-    def test_reload_config(self, sample_yaml_config):
-        """Test configuration reloading."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(sample_yaml_config)
-            temp_path = f.name
+class TestConfigLoader:
+    """Test cases for the ConfigLoader class."""
 
-        try:
-            loader = ConfigLoader(temp_path)
+    def test_initialization_with_custom_path(self):
+        """Test ConfigLoader initialization with custom path."""
+        custom_path = "/custom/path/config.yaml"
+        loader = ConfigLoader(custom_path)
 
-            # Load initial config
-            initial_config = loader.load_config()
-            assert len(loader.outlets) == 2
+        assert str(loader.config_path) == custom_path
 
-            # Reload config
-            reloaded_config = loader.reload_config()
-            assert reloaded_config == initial_config
-        finally:
-            os.unlink(temp_path)
+    def test_initialization_with_default_path(self):
+        """Test ConfigLoader initialization with default path."""
+        loader = ConfigLoader()
 
+        expected_path = Path(__file__).parent.parent.parent / "backend" / "scraper" / "config" / "outlets.yaml"
+        # Just check the filename since absolute paths may vary
+        assert loader.config_path.name == "outlets.yaml"
 
-class TestConfigLoaderConvenienceFunctions:
-    """Test cases for convenience functions."""
+    def test_load_config_success(self, shared_loader):
+        """Test successful configuration loading."""
+        loader = shared_loader
+        config_data = loader.config_data
 
-    @patch('scraper.config_loader.config_loader.get_outlet_config')
-    def test_get_outlet_config_convenience(self, mock_get_outlet_config):
-        """Test get_outlet_config convenience function."""
-        from scraper.config_loader import get_outlet_config
+        assert "outlets" in config_data
+        assert "defaults" in config_data
+        assert "validation" in config_data
+        assert len(loader.outlets) == 2
+        assert "test_outlet" in loader.outlets
+        assert "minimal_outlet" in loader.outlets
 
-        mock_config = {"name": "Test", "url": "https://test.ch"}
-        mock_get_outlet_config.return_value = mock_config
+    def test_load_config_file_not_found(self):
+        """Test configuration loading with non-existent file."""
+        loader = ConfigLoader("/non/existent/path.yaml")
 
-        result = get_outlet_config("test_outlet")
+        with pytest.raises(ConfigurationError, match=_ERR_NOT_FOUND):
+            loader.load_config()
 
-        assert result == mock_config
-        mock_get_outlet_config.assert_called_once_with("test_outlet")
+    def test_load_config_invalid_yaml(self, monkeypatch):
+        """Test configuration loading with invalid YAML."""
+        monkeypatch.setattr(
+            ConfigLoader, "_read_text", lambda self: "invalid: yaml: content: ["
+        )
 
-    @patch('scraper.config_loader.config_loader.get_all_outlets')
-    def test_get_all_outlets_convenience(self, mock_get_all_outlets):
-        """Test get_all_outlets convenience function."""
-        from scraper.config_loader import get_all_outlets
+        loader = ConfigLoader("/dev/null")
+        with pytest.raises(ConfigurationError, match=_ERR_PARSE):
+            loader.load_config()
 
-        mock_outlets = ["outlet1", "outlet2"]
-        mock_get_all_outlets.return_value = mock_outlets
+    def test_load_config_empty_file(self, monkeypatch):
+        """Test configuration loading with empty file."""
+        monkeypatch.setattr(ConfigLoader, "_read_text", lambda self: "")
+
+        loader = ConfigLoader("/dev/null")
+        with pytest.raises(ConfigurationError, match=_ERR_EMPTY):
+            loader.load_config()
+
+    def test_get_outlet_config_success(self, shared_loader):
+        """Test successful outlet configuration retrieval."""
+        loader = shared_loader
+        config = loader.get_outlet_config("test_outlet")
+
+        assert config["name"] == "Test Outlet"
+        assert config["url"] == "https://test.ch"
+        assert config["language"] == "de"
+        assert config["timeouts"]["page_load"] == 25
+        assert config["timeouts"]["element_wait"] == 8
+        assert config["retry"]["max_attempts"] == 2
+        assert config["retry"]["delay"] == 1.5
+
+    def test_get_outlet_config_with_defaults_merged(self, shared_loader):
+        """Test outlet configuration retrieval with defaults merged."""
+        loader = shared_loader
+        config = loader.get_outlet_config("minimal_outlet")
+
+        # Should have outlet-specific values
+        assert config["name"] == "Minimal Outlet"
+        assert config["url"] == "https://minimal.ch"
+        assert config["language"] == "fr"
+
+        # Should have defaults merged
+        assert config["timeouts"]["page_load"] == 30  # From defaults
+        assert config["timeouts"]["element_wait"] == 10  # From defaults
+        assert config["retry"]["max_attempts"] == 3  # From defaults
+        assert config["retry"]["delay"] == 2  # From defaults
+        assert config["user_agent"] == "Test Agent"  # From defaults
+
+    def test_get_outlet_config_not_found(self, sample_config_path):
+        """Test outlet configuration retrieval for non-existent outlet."""
+        loader = ConfigLoader(sample_config_path)
 
-        result = get_all_outlets()
+        with pytest.raises(ConfigurationError, match=_ERR_OUTLET_MISSING):
+            loader.get_outlet_config("non_existent")
 
-        assert result == mock_outlets
-        mock_get_all_outlets.assert_called_once()
+    def test_get_all_outlets(self, shared_loader):
+        """Test getting all outlet names."""
+        loader = shared_loader
+        outlets = loader.get_all_outlets()
+
+        assert len(outlets) == 2
+        assert "test_outlet" in outlets
+        assert "minimal_outlet" in outlets
+
+    def test_get_outlets_by_language(self, shared_loader):
+        """Test getting outlets filtered by language."""
+        loader = shared_loader
+
+        german_outlets = loader.get_outlets_by_language("de")
+        assert german_outlets == ["test_outlet"]
+
+        french_outlets = loader.get_outlets_by_language("fr")
+        assert french_outlets == ["minimal_outlet"]
+
+        italian_outlets = loader.get_outlets_by_language("it")
+        assert italian_outlets == []
+
+    def test_validate_outlet_config_missing_required_field(self, invalid_yaml_config, tmp_path):
+        """Test configuration validation with missing required fields."""
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text(invalid_yaml_config)
+
+        loader = ConfigLoader(temp_path)
+
+        with pytest.raises(ConfigurationError, match=_ERR_MISSING_FIELD):
+            loader.get_outlet_config("invalid_outlet")
+
+    @pytest.mark.parametrize("cfg, outlet, match", [
+        (_INVALID_LANGUAGE_YAML, "invalid_lang_outlet", _ERR_LANG),
+        (_INVALID_TIMEOUT_YAML, "invalid_timeout_outlet", _ERR_RANGE),
+        (_INVALID_RETRY_YAML, "invalid_retry_outlet", _ERR_RANGE),
+    ], ids=["unsupported_language", "timeout_limits", "retry_limits"])
+    def test_validate_outlet_config_invalid(self, tmp_path, cfg, outlet, match):
+        """Test configuration validation rejects out-of-policy outlet settings."""
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text(cfg)
+
+        loader = ConfigLoader(temp_path)
+
+        with pytest.raises(ConfigurationError, match=match):
+            loader.get_outlet_config(outlet)
+
+    def test_validate_all_outlets_success(self, shared_loader):
+        """Test validation of all outlets with success."""
+        loader = shared_loader
+        results = loader.validate_all_outlets()
+
+        assert len(results) == 2
+        assert results["test_outlet"] is True
+        assert results["minimal_outlet"] is True
+
+    def test_validate_all_outlets_with_failures(self, invalid_yaml_config, tmp_path):
+        """Test validation of all outlets with some failures."""
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text(invalid_yaml_config)
+
+        loader = ConfigLoader(temp_path)
+        results = loader.validate_all_outlets()
+
+        assert len(results) == 1
+        assert results["invalid_outlet"] is False
+
+    def test_reload_config(self, sample_config_path):
+        """Test configuration reloading."""
+        loader = ConfigLoader(sample_config_path)
+
+        # Load initial config
+        initial_config = loader.load_config()
+        assert len(loader.outlets) == 2
+
+        # Reload config
+        reloaded_config = loader.reload_config()
+        assert reloaded_config == initial_config
+
+
+class TestConfigLoaderConvenienceFunctions:
+    """Test cases for convenience functions."""
 
-    @patch('scraper.config_loader.config_loader.get_outlets_by_language')
-    def test_get_outlets_by_language_convenience(self, mock_get_outlets_by_language):
-        """Test get_outlets_by_language convenience function."""
-        from scraper.config_loader import get_outlets_by_language
+    @pytest.mark.parametrize("attr, args", [
+        ("get_outlet_config", ("test_outlet",)),
+        ("get_all_outlets", ()),
+        ("get_outlets_by_language", ("de",)),
+    ])
+    def test_convenience_function_delegates(self, attr, args):
+        """Test that each convenience function delegates to the global loader."""
+        from scraper import config_loader as module
 
-        mock_outlets = ["german_outlet"]
-        mock_get_outlets_by_language.return_value = mock_outlets
+        with patch(f"scraper.config_loader.config_loader.{attr}") as mock_method:
+            mock_method.return_value = sentinel.result
 
-        result = get_outlets_by_language("de")
+            result = getattr(module, attr)(*args)
 
-        assert result == mock_outlets
-        mock_get_outlets_by_language.assert_called_once_with("de")
+        assert result is sentinel.result
+        mock_method.assert_called_once_with(*args)
 
 
 if __name__ == "__main__":
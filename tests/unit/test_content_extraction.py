@@ -163,6 +163,77 @@ class TestArticleExtractorCore:
         # The actual selector used should be the one that worked
         assert "title" in result.extraction_metadata.selectors_used
 
+    def test_extract_full_content_bulk_query(self, sample_config):
+        """Test extraction from a single bulk script query without element lookups."""
+        extractor = ArticleExtractor(sample_config)
+        test_url = "https://test-outlet.ch/article/123"
+
+        # One record list per candidate selector; only the configured ones match
+        snapshot = {
+            name: [[] for _ in selectors]
+            for name, selectors in extractor._field_selectors.items()
+        }
+        snapshot["title"][0] = [{"text": "Test Article Title"}]
+        snapshot["subtitle"][0] = [{"text": "Test Article Subtitle"}]
+        snapshot["content"][0] = [
+            {"text": "This is the first paragraph of the article."},
+            {"text": "This is the second paragraph with more content."},
+        ]
+        snapshot["author"][0] = [{"text": "John Doe"}]
+        snapshot["date"][0] = [{"text": "", "datetime": "2024-01-01T14:30:00"}]
+        snapshot["tags"][0] = [{"text": "Politik"}, {"text": "Schweiz"}]
+        snapshot["images"][0] = [{
+            "text": "", "src": "/img/photo.jpg", "alt": "Bundeshaus",
+            "width": "800", "height": "600", "caption": "Das Bundeshaus in Bern",
+        }]
+
+        driver = Mock()
+        driver.execute_script.return_value = snapshot
+
+        result = extractor.extract_full_content(driver, test_url)
+
+        driver.execute_script.assert_called_once()
+        driver.find_element.assert_not_called()
+        driver.find_elements.assert_not_called()
+
+        assert result.title == "Test Article Title"
+        assert result.subtitle == "Test Article Subtitle"
+        assert result.author == "John Doe"
+        assert result.publication_date == datetime(2024, 1, 1, 14, 30)
+        assert len(result.body_paragraphs) == 2
+        assert set(result.tags) == {"Politik", "Schweiz"}
+        assert len(result.images) == 1
+        assert result.images[0].url == "https://test-outlet.ch/img/photo.jpg"
+        assert result.images[0].caption == "Das Bundeshaus in Bern"
+        assert result.extraction_metadata.selectors_used["title"] == "h1.article-title"
+
+    def test_bulk_query_skips_hidden_elements(self, sample_config):
+        """Test that hidden matches do not win selector priority in the bulk path."""
+        from scraper.extractors import _BULK_QUERY_JS
+
+        # Unrendered elements report empty text, like WebElement.text
+        assert "getClientRects().length === 0" in _BULK_QUERY_JS
+
+        extractor = ArticleExtractor(sample_config)
+        snapshot = {
+            name: [[] for _ in selectors]
+            for name, selectors in extractor._field_selectors.items()
+        }
+        title_selectors = extractor._field_selectors["title"]
+        # The configured selector only matches a hidden duplicate title
+        snapshot["title"][title_selectors.index("h1.article-title")] = [{"text": ""}]
+        snapshot["title"][title_selectors.index("h1")] = [{"text": "Visible Title"}]
+        snapshot["author"][0] = [{"text": ""}]
+
+        driver = Mock()
+        driver.execute_script.return_value = snapshot
+
+        result = extractor.extract_full_content(driver, "https://test-outlet.ch/a/1")
+
+        assert result.title == "Visible Title"
+        assert result.extraction_metadata.selectors_used["title"] == "h1"
+        assert result.author is None
+
     def test_extract_full_content_error_handling(self, sample_config):
         """Test error handling when extraction fails."""
         # Mock driver that throws exceptions
@@ -227,6 +298,18 @@ class TestContentProcessorTextCleaning:
         assert "  " not in cleaned  # No double spaces
         assert cleaned.strip() == cleaned  # No leading/trailing whitespace
 
+    def test_custom_remove_patterns_keep_own_groups(self):
+        """Test that outlet remove_patterns are applied independently."""
+        config = {
+            "text_processing": {
+                "remove_patterns": [r"(Promo)\s*:", r"\b(\w+)-\1\b"]
+            }
+        }
+
+        cleaned = advanced_clean_text("Promo: Hallo bla-bla Welt", "de", config)
+
+        assert cleaned == "Hallo Welt"
+
     def test_multilingual_ad_removal(self):
         """Test ad removal for different Swiss languages."""
         # German
@@ -273,6 +356,12 @@ class TestContentProcessorTextCleaning:
         assert "<div>" not in cleaned
         assert "Real content" in cleaned  # Content preserved
 
+    def test_html_artifacts_keep_literal_punctuation(self):
+        """Test that only decoded entities are folded to ASCII punctuation."""
+        assert clean_html_artifacts("l’article") == "l’article"
+        assert clean_html_artifacts("l’article &amp; co") == "l’article & co"
+        assert clean_html_artifacts("l&rsquo;article… &hellip;") == "l'article… ..."
+
     def test_paragraph_processing(self, processor_config):
         """Test paragraph processing and structure preservation."""
         processor = ContentProcessor(processor_config)
@@ -404,6 +493,15 @@ class TestContentValidation:
 
         assert validate_metadata_consistency(invalid_tags_metadata) is False
 
+    def test_metadata_author_validation(self):
+        """Test author validation on ASCII and accented names."""
+        from scraper.utils import validate_metadata_consistency
+
+        assert validate_metadata_consistency({"author": "Hans Mueller"}) is True
+        assert validate_metadata_consistency({"author": "Jérôme Müller"}) is True
+        assert validate_metadata_consistency({"author": "Hans 123"}) is False
+        assert validate_metadata_consistency({"author": "Jérôme #1"}) is False
+
 
 class TestImageExtraction:
     """Test image extraction functionality - Test 4/5"""
@@ -115,6 +115,12 @@ class TestSwissNewsWikipediaScraper(unittest.TestCase):
         self.assertEqual(outlet['owner'], '')
         self.assertEqual(outlet['canton'], '')
 
+    def test_session_retries_transient_errors(self):
+        """Test that the session retries server errors via its adapter."""
+        adapter = self.scraper.session.get_adapter(self.scraper.base_url)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
     @patch('wikipedia_scraper.requests.Session.get')
     def test_fetch_page_success(self, mock_get):
         """Test successful page fetching."""
@@ -128,6 +134,25 @@ class TestSwissNewsWikipediaScraper(unittest.TestCase):
         self.assertIsInstance(soup, BeautifulSoup)
         mock_get.assert_called_once()
 
+    @patch('wikipedia_scraper.requests.Session.get')
+    def test_fetch_page_keeps_only_wikitables(self, mock_get):
+        """Test that only outlet tables are parsed from the page."""
+        mock_response = Mock()
+        mock_response.content = (
+            b"<html><body><p>Intro</p>"
+            b"<table class='wikitable sortable'><tr><td>Outlet</td></tr></table>"
+            b"<table class='navbox'><tr><td>Nav</td></tr></table>"
+            b"</body></html>"
+        )
+        mock_get.return_value = mock_response
+
+        soup = self.scraper.fetch_page()
+
+        tables = soup.find_all("table")
+        self.assertEqual(len(tables), 1)
+        self.assertIn("wikitable", tables[0]["class"])
+        self.assertIsNone(soup.find("p"))
+
     @patch('wikipedia_scraper.requests.Session.get')
     def test_fetch_page_failure(self, mock_get):
         """Test page fetching failure."""